@@ -98,7 +98,9 @@ async def update_user_by_admin(
     Corresponds to SSR 8.5.6 PUT /api/v1/admin/users/{user_id}
     """
     user_service = UserService(db)
-    user = await user_service.get(db, id=user_id)  # Get the existing user
+    # Eager-load roles/permissions up front so reassigning user.roles in update_user
+    # doesn't trigger a lazy load of the old collection
+    user = await user_service.get_user_by_id_with_relations(user_id=user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -129,7 +131,7 @@ async def delete_user_by_admin(
     This example deactivates the user. True deletion would use user_service.remove().
     """
     user_service = UserService(db)
-    user = await user_service.get(db, id=user_id)
+    user = await user_service.get_user_by_id_with_relations(user_id=user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,11 +1,12 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies import get_db, get_current_user # Standard dependencies
 from app.schemas.unit_of_measurement_category import (
     UnitOfMeasurementCategory as UnitOfMeasurementCategorySchema, # Read Schema
-    UnitOfMeasurementCategoryCreate as UnitOfMeasurementCategoryCreateSchema
+    UnitOfMeasurementCategoryCreate as UnitOfMeasurementCategoryCreateSchema,
+    UnitOfMeasurementCategoryWithCount as UnitOfMeasurementCategoryWithCountSchema
 )
 from app.services import unit_of_measurement_category_service as uom_category_service
 from app.schemas.user import User as UserSchema # For current_user type hint
@@ -47,20 +48,32 @@ async def create_unit_of_measurement_category(
     return created_category
 
 
-@router.get("/list/", response_model=List[UnitOfMeasurementCategorySchema])
+@router.get("/list/", response_model=List[UnitOfMeasurementCategoryWithCountSchema])
 async def read_unit_of_measurement_categories(
+    response: Response,
     db: AsyncSession = Depends(get_db),
     offset: int = Query(0, description="Number of records to offset for pagination", ge=0),
     limit: int = Query(100, description="Maximum number of records to return", ge=1, le=200),
     # current_user: UserSchema = Depends(get_current_user) # Optional: Add if listing needs auth
 ):
     """
-    Retrieve a list of unit of measurement categories.
+    Retrieve a list of unit of measurement categories, with the number of units in each.
+    The total number of categories is returned in the `X-Total-Count` header.
     """
     categories = await uom_category_service.get_categories(db=db, offset=offset, limit=limit)
+    response.headers["X-Total-Count"] = str(await uom_category_service.count_categories(db=db))
     return categories
 
 
+@router.head("/list/")
+async def count_unit_of_measurement_categories(db: AsyncSession = Depends(get_db)) -> Response:
+    """
+    Return only the `X-Total-Count` header: a COUNT query, without fetching or serializing any rows.
+    """
+    total = await uom_category_service.count_categories(db=db)
+    return Response(headers={"X-Total-Count": str(total)})
+
+
 @router.get("/{category_id}", response_model=UnitOfMeasurementCategorySchema)
 async def read_unit_of_measurement_category(
     category_id: int,
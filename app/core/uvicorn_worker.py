@@ -0,0 +1,13 @@
+# app/core/uvicorn_worker.py
+from uvicorn.workers import UvicornWorker
+
+
+class LimitedUvicornWorker(UvicornWorker):
+    """
+    UvicornWorker with a per-worker concurrency cap (uvicorn's --limit-concurrency).
+    Once a worker has this many connections/tasks open, further requests get an
+    immediate 503 instead of piling up in its event loop.
+    Gunicorn's worker_connections only applies to eventlet/gevent workers.
+    """
+
+    CONFIG_KWARGS = {**UvicornWorker.CONFIG_KWARGS, "limit_concurrency": 1000}
@@ -1,5 +1,5 @@
 from sqlalchemy import Column, Integer, String
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import query_expression, relationship
 
 from .base_model import Base
 
@@ -12,5 +12,8 @@ class UnitOfMeasurementCategory(Base):
     # Relationships
     units_of_measurement = relationship("UnitOfMeasurement", back_populates="category")
 
+    # Number of units in the category; only populated by queries using with_expression()
+    uom_count = query_expression()
+
     def __repr__(self):
         return f"<UnitOfMeasurementCategory(id={self.id}, name='{self.name}')>"
@@ -2,7 +2,7 @@ from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 from jose import JWTError # Already imported in token_utils but good to have context
 
 from app.core.config import settings
@@ -47,16 +47,17 @@ async def get_current_user(
 
     # Placeholder for direct DB query until user_service is implemented:
     from sqlalchemy import select # Local import for this placeholder
-    # Ensure User.roles and Role.permissions are eager loaded
+    # Ensure User.roles and Role.permissions are eager loaded.
+    # A single user has few roles/permissions, so one JOINed query beats three selectin round-trips.
     user_query = (
         select(User)
         .options(
-            selectinload(User.roles).selectinload(Role.permissions)
+            joinedload(User.roles).joinedload(Role.permissions)
         )
         .where(User.email == token_data.email)
     )
     result = await db.execute(user_query)
-    user: Optional[User] = result.scalars().unique().first() # .unique() is good practice with selectinload
+    user: Optional[User] = result.scalars().unique().first() # .unique() is required with joined collection loads
     # End placeholder
 
     if user is None:
@@ -105,7 +106,7 @@ async def get_optional_current_user(
         user_query = (
             select(User)
             .options(
-                selectinload(User.roles).selectinload(Role.permissions)
+                joinedload(User.roles).joinedload(Role.permissions)
             )
             .where(User.email == token_data.email)
         )
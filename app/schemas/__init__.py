@@ -11,7 +11,7 @@ from .reporting_unit import (
 # Assuming these files now exist and define the specified schemas:
 from .unit_of_measurement import UnitOfMeasurement, UnitOfMeasurementCreate, UnitOfMeasurementUpdate
 
-from .unit_of_measurement_category import UnitOfMeasurementCategory, UnitOfMeasurementCategoryCreate, UnitOfMeasurementCategoryBase # New import
+from .unit_of_measurement_category import UnitOfMeasurementCategory, UnitOfMeasurementCategoryCreate, UnitOfMeasurementCategoryBase, UnitOfMeasurementCategoryWithCount # New import
 
 from .temporal_resolution import TemporalResolution, TemporalResolutionCreate, TemporalResolutionUpdate
 from .data_quality_flag import DataQualityFlag, DataQualityFlagCreate, DataQualityFlagUpdate
@@ -61,6 +61,7 @@ ReportingUnitType.model_rebuild(force=True) # Usually simple, but good practice
 UnitOfMeasurement.model_rebuild(force=True)
 
 UnitOfMeasurementCategory.model_rebuild(force=True) # New model_rebuild
+UnitOfMeasurementCategoryWithCount.model_rebuild(force=True)
 
 TemporalResolution.model_rebuild(force=True)
 DataQualityFlag.model_rebuild(force=True)
@@ -94,7 +95,7 @@ __all__ = [
     "ReportingUnitType", "ReportingUnitTypeCreate", "ReportingUnitTypeUpdate",
     "UnitOfMeasurement", "UnitOfMeasurementCreate", "UnitOfMeasurementUpdate",
 
-    "UnitOfMeasurementCategoryBase", "UnitOfMeasurementCategoryCreate", "UnitOfMeasurementCategory", # New schemas in __all__
+    "UnitOfMeasurementCategoryBase", "UnitOfMeasurementCategoryCreate", "UnitOfMeasurementCategory", "UnitOfMeasurementCategoryWithCount", # New schemas in __all__
 
     "TemporalResolution", "TemporalResolutionCreate", "TemporalResolutionUpdate",
     "DataQualityFlag", "DataQualityFlagCreate", "DataQualityFlagUpdate",
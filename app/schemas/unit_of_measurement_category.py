@@ -16,3 +16,8 @@ class UnitOfMeasurementCategory(UnitOfMeasurementCategoryBase):
 
     class Config:
         from_attributes = True
+
+# Schema for list responses: adds the number of units in each category,
+# which the service computes with a COUNT instead of loading the units
+class UnitOfMeasurementCategoryWithCount(UnitOfMeasurementCategory):
+    uom_count: int
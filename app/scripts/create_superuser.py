@@ -3,7 +3,10 @@ import typer
 import os
 import sys
 import logging
+from sqlalchemy import or_, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 from typing import Optional
 
 # Suppress bcrypt version warnings
@@ -17,6 +20,7 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from app.core.config import settings
+from app.database.models.user import User
 from app.database.session import AsyncSessionFactory
 from app.schemas.user import UserCreate
 from app.services.user_service import UserService
@@ -34,10 +38,15 @@ async def create_superuser(
     """Core logic to create or update superuser"""
     user_service = UserService(db)
 
-    # Check if user exists by username or email
-    user = await user_service.get_user_by_username(username)
-    if not user:
-        user = await user_service.get_user_by_email(email)
+    # Check if user exists by username or email in a single round-trip (username match wins).
+    # Only the columns used below are loaded; hashed_password etc. are never needed here.
+    result = await db.execute(
+        select(User)
+        .options(load_only(User.username, User.email, User.is_superuser))
+        .where(or_(User.username == username, User.email == email))
+    )
+    matches = result.scalars().all()
+    user = next((u for u in matches if u.username == username), matches[0] if matches else None)
 
     if user:
         print(f"User found: ID={user.id}, Email={user.email}")
@@ -59,7 +68,13 @@ async def create_superuser(
             is_superuser=True,
             is_active=True
         )
-        user = await user_service.create_user(user_in)
+        try:
+            user = await user_service.create_user(user_in)
+        except IntegrityError:
+            # Another process created the same username/email between the lookup and the insert
+            await db.rollback()
+            print(f"Could not create superuser: username '{username}' or email '{email}' already exists")
+            return
         print(f"Superuser created: ID={user.id}")
 
     print(f"Superuser details: ID={user.id}, Email={user.email}, Username={user.username}")
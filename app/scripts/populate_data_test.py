@@ -6,8 +6,9 @@ from typing import List, Dict, Any, Optional, Type, TypeVar
 from geoalchemy2 import WKTElement
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload, attributes
-from sqlalchemy import text as sql_text
+from sqlalchemy.orm import selectinload
+from sqlalchemy import text as sql_text, delete, func, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError # Moved import to top
 
 import sys
@@ -19,6 +20,7 @@ if project_root_dir not in sys.path:
 
 from app.database.session import AsyncSessionFactory
 from app.database.models.base_model import Base
+from app.database.models.role_permission import role_permissions_association, user_roles_association
 from app.database.models import (
     Permission, Role, User, ReportingUnitType, ReportingUnit, UnitOfMeasurement,
     TemporalResolution, DataQualityFlag, IndicatorCategory, IndicatorDefinition,
@@ -103,6 +105,16 @@ async def _get_or_create(session: AsyncSession, model_cls: Type[ModelType], defa
     return instance, created
 
 
+def _upsert_descriptions(model_cls: Type[ModelType], rows: List[Dict[str, Any]]):
+    """INSERT ... ON CONFLICT (name) DO UPDATE of description, skipping rows whose description is unchanged."""
+    stmt = pg_insert(model_cls).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=["name"],
+        set_={"description": stmt.excluded.description, "updated_at": func.now()},
+        where=model_cls.description.is_distinct_from(stmt.excluded.description),
+    )
+
+
 def get_random_element(db_list: List[Any], allow_none: bool = False, none_probability: float = 0.1) -> Any:
     if not db_list: return None
     if allow_none and random.random() < none_probability: return None
@@ -126,133 +138,130 @@ async def create_permissions(session: AsyncSession) -> List[Permission]:
         {"name": "settings:edit:basin_A", "description": "Can edit settings for Basin A."},
         {"name": "users:manage", "description": "Can manage users and roles."} # Specific version for user management
     ]
-    permissions = []
-    for p_data in permissions_data:
-        perm, _ = await _get_or_create(session, Permission, {"description": p_data["description"]}, name=p_data["name"])
-        permissions.append(perm)
-    await session.flush()
+    # One upsert for all permissions (keeps descriptions in sync with this script), then one SELECT to load them back
+    await session.execute(_upsert_descriptions(Permission, permissions_data))
+    result = await session.execute(
+        select(Permission).where(Permission.name.in_([p["name"] for p in permissions_data]))
+    )
+    permissions = list(result.scalars().all())
     print(f"Created/found {len(permissions)} permissions.")
     return permissions
 
 
 async def create_roles(session: AsyncSession, all_permissions: List[Permission]) -> List[Role]:
     print("Creating roles...")
-
-    # Helper to find permissions by name for role definitions
-    def get_perms_by_names(names: List[str]) -> List[Permission]:
-        return [p for p in all_permissions if p.name in names]
+    permissions_by_name = {p.name: p for p in all_permissions}
 
     roles_data_from_script = [
         {
             "name": "Administrator",
             "description": "System Administrator",
             # Assign all known specific permissions. The original "all_permissions" was too broad if new permissions are added.
-            "permissions_to_link": get_perms_by_names([
+            "permission_names": [
                 "data:view:all", "users:manage", "settings:edit:basin_A",
                 "view_all_dashboards", "manage_roles", "enter_basin_data",
                 "approve_basin_data", "view_financial_reports", "manage_infrastructure_data"
-            ])
+            ]
         },
         {
             "name": "DataManager",
             "description": "Manages data",
-            "permissions_to_link": get_perms_by_names([
+            "permission_names": [
                 "data:view:all", "view_all_dashboards", "enter_basin_data", "approve_basin_data",
                 "manage_infrastructure_data" # DataManagers might manage infrastructure
-            ])
+            ]
         },
         {
             "name": "ReportingAnalyst",
             "description": "Views data and reports",
-            "permissions_to_link": get_perms_by_names(["data:view:all", "view_all_dashboards", "view_financial_reports"])
+            "permission_names": ["data:view:all", "view_all_dashboards", "view_financial_reports"]
         },
         { # Added from populate_test_data.py
             "name": "DataViewer",
             "description": "Can view data.",
-            "permissions_to_link": get_perms_by_names(["data:view:all", "view_all_dashboards"])
+            "permission_names": ["data:view:all", "view_all_dashboards"]
         }
     ]
-    created_roles_list = []
-    for r_data in roles_data_from_script:
-        role_instance, created = await _get_or_create(session, Role, defaults={"description": r_data["description"]},
-                                                      load_relationships=["permissions"], name=r_data["name"])
-        if created:
-            await session.flush()
-            print(f"Role '{role_instance.name}' created with ID {role_instance.id}.")
-            attributes.set_committed_value(role_instance, 'permissions', [])
-            print(f"Set committed (empty) 'permissions' state for new role '{role_instance.name}'.")
-        else:
-            if role_instance: print(
-                f"Role '{role_instance.name}' (ID: {role_instance.id}) exists. Permissions eager-loaded.")
-        if r_data.get("permissions_to_link") and role_instance:
-            current_assigned_permission_ids = {p.id for p in role_instance.permissions if p.id is not None}
-            needs_flush = False
-            for perm_obj in r_data["permissions_to_link"]:
-                if perm_obj.id is None: print(f"Warning: Perm '{perm_obj.name}' has no ID."); continue
-                if perm_obj.id not in current_assigned_permission_ids:
-                    role_instance.permissions.append(perm_obj);
-                    needs_flush = True
-                    print(f"Queueing perm '{perm_obj.name}' for role '{role_instance.name}'.")
-            if needs_flush: session.add(role_instance); await session.flush(); print(
-                f"Flushed perm assignments for role '{role_instance.name}'.")
-        if role_instance: created_roles_list.append(role_instance)
-    print(f"Processed {len(created_roles_list)} roles.")
+    await session.execute(_upsert_descriptions(
+        Role, [{"name": r["name"], "description": r["description"]} for r in roles_data_from_script]
+    ))
+    result = await session.execute(
+        select(Role).where(Role.name.in_([r["name"] for r in roles_data_from_script]))
+    )
+    roles_by_name = {role.name: role for role in result.scalars().all()}
+
+    # Sync role/permission links with set semantics: diff the target links against the current ones
+    # and only DELETE/INSERT the difference, so re-running the script on a seeded DB writes nothing.
+    target_links = {
+        (roles_by_name[r["name"]].id, permissions_by_name[perm_name].id)
+        for r in roles_data_from_script
+        for perm_name in r["permission_names"]
+        if perm_name in permissions_by_name
+    }
+    rp = role_permissions_association.c
+    result = await session.execute(
+        select(rp.role_id, rp.permission_id).where(rp.role_id.in_([role.id for role in roles_by_name.values()]))
+    )
+    current_links = set(result.tuples().all())
+
+    stale_links = current_links - target_links
+    missing_links = target_links - current_links
+    if stale_links:
+        await session.execute(
+            delete(role_permissions_association).where(tuple_(rp.role_id, rp.permission_id).in_(list(stale_links)))
+        )
+    if missing_links:
+        await session.execute(
+            pg_insert(role_permissions_association)
+            .values([{"role_id": role_id, "permission_id": perm_id} for role_id, perm_id in missing_links])
+            .on_conflict_do_nothing()
+        )
+
+    created_roles_list = [roles_by_name[r["name"]] for r in roles_data_from_script]
+    print(f"Processed {len(created_roles_list)} roles: "
+          f"{len(missing_links)} permission links added, {len(stale_links)} removed.")
     return created_roles_list
 
 
 async def create_users(session: AsyncSession, all_roles: List[Role]) -> List[User]:
     print("Creating users...")
-    created_users_list = []
     admin_role = next((r for r in all_roles if r.name == "Administrator"), None)
     if not admin_role and all_roles: admin_role = all_roles[0]
     if not admin_role: print("Warning: No Administrator role for admin user.")
     default_password = settings.DEFAULT_SUPERUSER_PASSWORD if hasattr(settings,
                                                                       'DEFAULT_SUPERUSER_PASSWORD') and settings.DEFAULT_SUPERUSER_PASSWORD else "supersecretpassword123!"
-    admin_defaults = {"full_name": "Admin User", "is_superuser": True, "is_active": True,
-                      "hashed_password": Hasher.get_password_hash(default_password)}
-    admin_user, admin_created = await _get_or_create(session, User, defaults=admin_defaults,
-                                                     load_relationships=["roles"], email="admin@example.com")
-    if admin_created:
-        await session.flush();
-        print(f"User '{admin_user.email}' created with ID {admin_user.id}.")
-        attributes.set_committed_value(admin_user, 'roles', [])
-        print(f"Set committed (empty) 'roles' state for new user '{admin_user.email}'.")
-    else:
-        if admin_user: print(f"User '{admin_user.email}' (ID: {admin_user.id}) exists. Roles eager-loaded.")
-    if admin_user and admin_role:
-        current_admin_role_ids = {r.id for r in admin_user.roles if r.id is not None}
-        if admin_role.id not in current_admin_role_ids:
-            admin_user.roles.append(admin_role);
-            session.add(admin_user);
-            print(f"Queueing admin role for {admin_user.email}")
-    if admin_user: created_users_list.append(admin_user)
+
+    # (user fields, plain password, role to assign)
+    users_data = [({"email": "admin@example.com", "full_name": "Admin User", "is_superuser": True, "is_active": True},
+                   default_password, admin_role)]
     for i in range(1, NUM_USERS + 1):
-        user_email = f"user{i}@example.com"
-        user_defaults = {"full_name": f"Test User {i}", "is_superuser": False,
-                         "is_active": random.choice([True, True, False]),
-                         "hashed_password": Hasher.get_password_hash("password123")}
-        user, user_created = await _get_or_create(session, User, defaults=user_defaults, load_relationships=["roles"],
-                                                  email=user_email)
-        if user_created:
-            await session.flush();
-            print(f"User '{user.email}' created with ID {user.id}.")
-            attributes.set_committed_value(user, 'roles', [])
-            print(f"Set committed (empty) 'roles' state for new user '{user.email}'.")
-        else:
-            if user: print(f"User '{user.email}' (ID: {user.id}) exists. Roles eager-loaded.")
-        if user and all_roles:
-            assigned_role = get_random_element(all_roles)
-            if assigned_role:
-                current_user_role_ids = {r.id for r in user.roles if r.id is not None}
-                if assigned_role.id not in current_user_role_ids:
-                    user.roles.append(assigned_role);
-                    session.add(user);
-                    print(f"Queueing role '{assigned_role.name}' for user '{user.email}'")
-        if user: created_users_list.append(user)
-    if any(session.is_modified(obj) for obj in created_users_list if
-           obj in session and hasattr(obj, 'roles') and attributes.get_history(obj, 'roles').has_changes()):
-        await session.flush();
-        print(f"Flushed user creations and role assignments.")
+        user_fields = {"email": f"user{i}@example.com", "full_name": f"Test User {i}", "is_superuser": False,
+                       "is_active": random.choice([True, True, False])}
+        users_data.append((user_fields, "password123", get_random_element(all_roles)))
+    emails = [fields["email"] for fields, _, _ in users_data]
+
+    # Single existence check instead of one SELECT per user; only new users pay for password hashing
+    result = await session.execute(select(User.email).where(User.email.in_(emails)))
+    existing_emails = set(result.scalars().all())
+    new_users = [{**fields, "hashed_password": Hasher.get_password_hash(password)}
+                 for fields, password, _ in users_data if fields["email"] not in existing_emails]
+    if new_users:
+        await session.execute(pg_insert(User).values(new_users).on_conflict_do_nothing(index_elements=["email"]))
+    print(f"Created {len(new_users)} users, {len(existing_emails)} already existed.")
+
+    result = await session.execute(select(User).where(User.email.in_(emails)))
+    users_by_email = {user.email: user for user in result.scalars().all()}
+
+    user_role_rows = [
+        {"user_id": users_by_email[fields["email"]].id, "role_id": role.id}
+        for fields, _, role in users_data
+        if role is not None and fields["email"] in users_by_email
+    ]
+    if user_role_rows:
+        await session.execute(pg_insert(user_roles_association).values(user_role_rows).on_conflict_do_nothing())
+        print(f"Assigned roles with {len(user_role_rows)} user/role links.")
+
+    created_users_list = [users_by_email[email] for email in emails if email in users_by_email]
     print(f"Processed {len(created_users_list)} users.")
     return created_users_list
 
@@ -1,8 +1,11 @@
 from typing import List, Optional
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.exc import IntegrityError # To handle potential unique constraint violations
+from sqlalchemy.orm import with_expression
 
+from app.database.models.unit_of_measurement import UnitOfMeasurement as UnitOfMeasurementModel
 from app.database.models.unit_of_measurement_category import UnitOfMeasurementCategory as UnitOfMeasurementCategoryModel
 from app.schemas.unit_of_measurement_category import UnitOfMeasurementCategoryCreate as UnitOfMeasurementCategoryCreateSchema
 # Using aliased imports for clarity between model and schema if names were identical
@@ -55,10 +58,30 @@ async def get_categories(
 ) -> List[UnitOfMeasurementCategoryModel]:
     """
     Get a list of unit of measurement categories with pagination.
+    Each returned category has its `uom_count` expression loaded with the number of units in it,
+    aggregated in SQL so the units themselves are never loaded.
     """
-    query = select(UnitOfMeasurementCategoryModel).offset(offset).limit(limit).order_by(UnitOfMeasurementCategoryModel.id)
+    query = (
+        select(UnitOfMeasurementCategoryModel)
+        .outerjoin(UnitOfMeasurementCategoryModel.units_of_measurement)
+        .options(with_expression(UnitOfMeasurementCategoryModel.uom_count, func.count(UnitOfMeasurementModel.id)))
+        .group_by(UnitOfMeasurementCategoryModel.id)
+        .order_by(UnitOfMeasurementCategoryModel.id)
+        .offset(offset)
+        .limit(limit)
+        # with_expression() won't overwrite a count already loaded on a category in the session
+        .execution_options(populate_existing=True)
+    )
     result = await db.execute(query)
-    return result.scalars().all()
+    return list(result.scalars().all())
+
+
+async def count_categories(db: AsyncSession) -> int:
+    """
+    Get the total number of unit of measurement categories.
+    """
+    result = await db.execute(select(func.count()).select_from(UnitOfMeasurementCategoryModel))
+    return result.scalar_one()
 
 
 async def get_category_by_name(
@@ -1,4 +1,36 @@
 import json
+import sys
+from pathlib import Path
+from urllib.parse import urlencode
+
+import orjson
+
+# Shared by every request URL instead of allocating a fresh ["{{baseUrl}}"] per request
+BASE_HOST = [sys.intern("{{baseUrl}}")]
+
+
+def _url(*segments, query=(), variable=()):
+    """Build a Postman URL object; "raw" is derived from the path and the enabled query params."""
+    raw = "{{baseUrl}}/" + "/".join(segments)
+    enabled = [(q["key"], q["value"]) for q in query if not q.get("disabled")]
+    if enabled:
+        raw += "?" + urlencode(enabled)
+    url = {"raw": raw, "host": BASE_HOST, "path": list(segments)}
+    if query:
+        url["query"] = list(query)
+    if variable:
+        url["variable"] = list(variable)
+    return url
+
+
+def _get_request(name, url, description):
+    """Template for the plain GET request items that make up most of the collection."""
+    return {
+        "name": name,
+        "request": {"method": "GET", "header": [], "url": url, "description": description},
+        "response": [],
+    }
+
 
 collection = {
     "info": {
@@ -29,11 +61,7 @@ login_request = {
                 {"key": "password", "value": "string", "type": "text"}
             ]
         },
-        "url": {
-            "raw": "{{baseUrl}}/api/v1/auth/login",
-            "host": ["{{baseUrl}}"],
-            "path": ["api", "v1", "auth", "login"]
-        },
+        "url": _url("api", "v1", "auth", "login"),
         "description": "Authenticate to get the access token."
     },
     "event": [
@@ -54,20 +82,11 @@ login_request = {
 collection["item"].append(login_request)
 
 # Define the "Get Current User" request
-get_current_user_request = {
-    "name": "Get Current User",
-    "request": {
-        "method": "GET",
-        "header": [],
-        "url": {
-            "raw": "{{baseUrl}}/api/v1/auth/me",
-            "host": ["{{baseUrl}}"],
-            "path": ["api", "v1", "auth", "me"]
-        },
-        "description": "Retrieves the currently authenticated user's details."
-    },
-    "response": []
-}
+get_current_user_request = _get_request(
+    "Get Current User",
+    _url("api", "v1", "auth", "me"),
+    "Retrieves the currently authenticated user's details."
+)
 collection["item"].append(get_current_user_request)
 
 # Define the "Admin - Users" folder and its requests
@@ -87,40 +106,29 @@ admin_users_folder = {
                     }, indent=4),
                     "options": {"raw": {"language": "json"}}
                 },
-                "url": {
-                    "raw": "{{baseUrl}}/api/v1/admin/users/", "host": ["{{baseUrl}}"],
-                    "path": ["api", "v1", "admin", "users", ""]
-                },
+                "url": _url("api", "v1", "admin", "users", ""),
                 "description": "Create new user by an admin. Requires superuser privileges."
             }, "response": []
         },
-        {
-            "name": "List Users",
-            "request": {
-                "method": "GET", "header": [],
-                "url": {
-                    "raw": "{{baseUrl}}/api/v1/admin/users/?skip=0&limit=10&filter_params=%7B%22username%22%3A%20%22test%22%7D",
-                    "host": ["{{baseUrl}}"], "path": ["api", "v1", "admin", "users", ""],
-                    "query": [
-                        {"key": "skip", "value": "0"}, {"key": "limit", "value": "10"},
-                        {"key": "filter_params", "value": "{\"username\": \"test\"}", "disabled": True}
-                    ]
-                },
-                "description": "Read users with pagination. Requires superuser privileges."
-            }, "response": []
-        },
-        {
-            "name": "Get User by ID",
-            "request": {
-                "method": "GET", "header": [],
-                "url": {
-                    "raw": "{{baseUrl}}/api/v1/admin/users/{{user_id}}", "host": ["{{baseUrl}}"],
-                    "path": ["api", "v1", "admin", "users", "{{user_id}}"],
-                    "variable": [{"key": "user_id", "value": "1"}]
-                },
-                "description": "Get a specific user by ID. Requires superuser privileges."
-            }, "response": []
-        },
+        _get_request(
+            "List Users",
+            _url(
+                "api", "v1", "admin", "users", "",
+                query=[
+                    {"key": "skip", "value": "0"}, {"key": "limit", "value": "10"},
+                    {"key": "filter_params", "value": "{\"username\": \"test\"}", "disabled": True}
+                ]
+            ),
+            "Read users with pagination. Requires superuser privileges."
+        ),
+        _get_request(
+            "Get User by ID",
+            _url(
+                "api", "v1", "admin", "users", "{{user_id}}",
+                variable=[{"key": "user_id", "value": "1"}]
+            ),
+            "Get a specific user by ID. Requires superuser privileges."
+        ),
         {
             "name": "Update User",
             "request": {
@@ -134,11 +142,10 @@ admin_users_folder = {
                     }, indent=4),
                     "options": {"raw": {"language": "json"}}
                 },
-                "url": {
-                    "raw": "{{baseUrl}}/api/v1/admin/users/{{user_id}}", "host": ["{{baseUrl}}"],
-                    "path": ["api", "v1", "admin", "users", "{{user_id}}"],
-                    "variable": [{"key": "user_id", "value": "1"}]
-                },
+                "url": _url(
+                    "api", "v1", "admin", "users", "{{user_id}}",
+                    variable=[{"key": "user_id", "value": "1"}]
+                ),
                 "description": "Update a user. Requires superuser privileges."
             }, "response": []
         },
@@ -146,11 +153,10 @@ admin_users_folder = {
             "name": "Delete User",
             "request": {
                 "method": "DELETE", "header": [],
-                "url": {
-                    "raw": "{{baseUrl}}/api/v1/admin/users/{{user_id}}", "host": ["{{baseUrl}}"],
-                    "path": ["api", "v1", "admin", "users", "{{user_id}}"],
-                    "variable": [{"key": "user_id", "value": "1"}]
-                },
+                "url": _url(
+                    "api", "v1", "admin", "users", "{{user_id}}",
+                    variable=[{"key": "user_id", "value": "1"}]
+                ),
                 "description": "Deactivate a user (soft delete). Requires superuser privileges."
             }, "response": []
         }
@@ -162,146 +168,90 @@ collection["item"].append(admin_users_folder)
 metadata_catalog_folder = {
     "name": "Metadata Catalog",
     "item": [
-        {
-            "name": "Get Geographic Units",
-            "request": {
-                "method": "GET", "header": [],
-                "url": {
-                    "raw": "{{baseUrl}}/api/v1/metadata/geographic-units?skip=0&limit=100",
-                    "host": ["{{baseUrl}}"], "path": ["api", "v1", "metadata", "geographic-units"],
-                    "query": [
-                        {"key": "unit_type_id", "value": "", "disabled": True, "description": "(integer, optional)"},
-                        {"key": "parent_unit_id", "value": "", "disabled": True, "description": "(integer, optional)"},
-                        {"key": "search", "value": "", "disabled": True, "description": "(string, optional)"},
-                        {"key": "skip", "value": "0"},
-                        {"key": "limit", "value": "100"}
-                    ]
-                },
-                "description": "Retrieve a list of available geographic/reporting units."
-            }, "response": []
-        },
-        {
-            "name": "Get Geographic Unit by ID",
-            "request": {
-                "method": "GET", "header": [],
-                "url": {
-                    "raw": "{{baseUrl}}/api/v1/metadata/geographic-units/{{unit_id}}",
-                    "host": ["{{baseUrl}}"], "path": ["api", "v1", "metadata", "geographic-units", "{{unit_id}}"],
-                    "variable": [{"key": "unit_id", "value": "1", "description": "(integer)"}]
-                },
-                "description": "Retrieve a specific geographic/reporting unit by its ID."
-            }, "response": []
-        },
-        {
-            "name": "Get Geographic Unit Types",
-            "request": {
-                "method": "GET", "header": [],
-                "url": {
-                    "raw": "{{baseUrl}}/api/v1/metadata/geographic-unit-types",
-                    "host": ["{{baseUrl}}"], "path": ["api", "v1", "metadata", "geographic-unit-types"]
-                },
-                "description": "Retrieve a list of available geographic/reporting unit types."
-            }, "response": []
-        },
-        {
-            "name": "Get Indicators",
-            "request": {
-                "method": "GET", "header": [],
-                "url": {
-                    "raw": "{{baseUrl}}/api/v1/metadata/indicators?skip=0&limit=100",
-                    "host": ["{{baseUrl}}"], "path": ["api", "v1", "metadata", "indicators"],
-                    "query": [
-                        {"key": "category_id", "value": "", "disabled": True, "description": "(integer, optional)"},
-                        {"key": "data_type", "value": "", "disabled": True, "description": "(string, optional)"},
-                        {"key": "skip", "value": "0"},
-                        {"key": "limit", "value": "100"}
-                    ]
-                },
-                "description": "Retrieve a list of available WA+ indicator definitions."
-            }, "response": []
-        },
-        {
-            "name": "Get Indicator by Code",
-            "request": {
-                "method": "GET", "header": [],
-                "url": {
-                    "raw": "{{baseUrl}}/api/v1/metadata/indicators/{{indicator_code}}",
-                    "host": ["{{baseUrl}}"], "path": ["api", "v1", "metadata", "indicators", "{{indicator_code}}"],
-                    "variable": [{"key": "indicator_code", "value": "WP", "description": "(string)"}]
-                },
-                "description": "Retrieve a specific indicator definition by its code."
-            }, "response": []
-        },
-        {
-            "name": "Get Indicator Categories",
-            "request": {
-                "method": "GET", "header": [],
-                "url": {
-                    "raw": "{{baseUrl}}/api/v1/metadata/indicator-categories",
-                    "host": ["{{baseUrl}}"], "path": ["api", "v1", "metadata", "indicator-categories"]
-                },
-                "description": "Retrieve available indicator categories."
-            }, "response": []
-        },
-        {
-            "name": "Get Units of Measurement",
-            "request": {
-                "method": "GET", "header": [],
-                "url": {
-                    "raw": "{{baseUrl}}/api/v1/metadata/units-of-measurement",
-                    "host": ["{{baseUrl}}"], "path": ["api", "v1", "metadata", "units-of-measurement"]
-                },
-                "description": "Retrieve available units of measurement."
-            }, "response": []
-        },
-        {
-            "name": "Get Temporal Resolutions",
-            "request": {
-                "method": "GET", "header": [],
-                "url": {
-                    "raw": "{{baseUrl}}/api/v1/metadata/temporal-resolutions",
-                    "host": ["{{baseUrl}}"], "path": ["api", "v1", "metadata", "temporal-resolutions"]
-                },
-                "description": "Retrieve available temporal resolutions. (Currently not fully implemented in service)"
-            }, "response": []
-        },
-        {
-            "name": "Get Data Quality Flags",
-            "request": {
-                "method": "GET", "header": [],
-                "url": {
-                    "raw": "{{baseUrl}}/api/v1/metadata/data-quality-flags",
-                    "host": ["{{baseUrl}}"], "path": ["api", "v1", "metadata", "data-quality-flags"]
-                },
-                "description": "Retrieve available data quality flags. (Currently not fully implemented in service)"
-            }, "response": []
-        },
-        {
-            "name": "Get Infrastructure Types",
-            "request": {
-                "method": "GET", "header": [],
-                "url": {
-                    "raw": "{{baseUrl}}/api/v1/metadata/infrastructure-types",
-                    "host": ["{{baseUrl}}"], "path": ["api", "v1", "metadata", "infrastructure-types"]
-                },
-                "description": "Retrieve available infrastructure types."
-            }, "response": []
-        },
-        {
-            "name": "Get Crops",
-            "request": {
-                "method": "GET", "header": [],
-                "url": {
-                    "raw": "{{baseUrl}}/api/v1/metadata/crops?skip=0&limit=100",
-                    "host": ["{{baseUrl}}"], "path": ["api", "v1", "metadata", "crops"],
-                    "query": [
-                        {"key": "skip", "value": "0"},
-                        {"key": "limit", "value": "100"}
-                    ]
-                },
-                "description": "Retrieve a list of available crop types. (Currently not fully implemented in service)"
-            }, "response": []
-        }
+        _get_request(
+            "Get Geographic Units",
+            _url(
+                "api", "v1", "metadata", "geographic-units",
+                query=[
+                    {"key": "unit_type_id", "value": "", "disabled": True, "description": "(integer, optional)"},
+                    {"key": "parent_unit_id", "value": "", "disabled": True, "description": "(integer, optional)"},
+                    {"key": "search", "value": "", "disabled": True, "description": "(string, optional)"},
+                    {"key": "skip", "value": "0"},
+                    {"key": "limit", "value": "100"}
+                ]
+            ),
+            "Retrieve a list of available geographic/reporting units."
+        ),
+        _get_request(
+            "Get Geographic Unit by ID",
+            _url(
+                "api", "v1", "metadata", "geographic-units", "{{unit_id}}",
+                variable=[{"key": "unit_id", "value": "1", "description": "(integer)"}]
+            ),
+            "Retrieve a specific geographic/reporting unit by its ID."
+        ),
+        _get_request(
+            "Get Geographic Unit Types",
+            _url("api", "v1", "metadata", "geographic-unit-types"),
+            "Retrieve a list of available geographic/reporting unit types."
+        ),
+        _get_request(
+            "Get Indicators",
+            _url(
+                "api", "v1", "metadata", "indicators",
+                query=[
+                    {"key": "category_id", "value": "", "disabled": True, "description": "(integer, optional)"},
+                    {"key": "data_type", "value": "", "disabled": True, "description": "(string, optional)"},
+                    {"key": "skip", "value": "0"},
+                    {"key": "limit", "value": "100"}
+                ]
+            ),
+            "Retrieve a list of available WA+ indicator definitions."
+        ),
+        _get_request(
+            "Get Indicator by Code",
+            _url(
+                "api", "v1", "metadata", "indicators", "{{indicator_code}}",
+                variable=[{"key": "indicator_code", "value": "WP", "description": "(string)"}]
+            ),
+            "Retrieve a specific indicator definition by its code."
+        ),
+        _get_request(
+            "Get Indicator Categories",
+            _url("api", "v1", "metadata", "indicator-categories"),
+            "Retrieve available indicator categories."
+        ),
+        _get_request(
+            "Get Units of Measurement",
+            _url("api", "v1", "metadata", "units-of-measurement"),
+            "Retrieve available units of measurement."
+        ),
+        _get_request(
+            "Get Temporal Resolutions",
+            _url("api", "v1", "metadata", "temporal-resolutions"),
+            "Retrieve available temporal resolutions. (Currently not fully implemented in service)"
+        ),
+        _get_request(
+            "Get Data Quality Flags",
+            _url("api", "v1", "metadata", "data-quality-flags"),
+            "Retrieve available data quality flags. (Currently not fully implemented in service)"
+        ),
+        _get_request(
+            "Get Infrastructure Types",
+            _url("api", "v1", "metadata", "infrastructure-types"),
+            "Retrieve available infrastructure types."
+        ),
+        _get_request(
+            "Get Crops",
+            _url(
+                "api", "v1", "metadata", "crops",
+                query=[
+                    {"key": "skip", "value": "0"},
+                    {"key": "limit", "value": "100"}
+                ]
+            ),
+            "Retrieve a list of available crop types. (Currently not fully implemented in service)"
+        )
     ]
 }
 collection["item"].append(metadata_catalog_folder)
@@ -310,52 +260,45 @@ collection["item"].append(metadata_catalog_folder)
 time_series_data_folder = {
     "name": "Time Series Data",
     "item": [
-        {
-            "name": "Get Time Series Data",
-            "request": {
-                "method": "GET",
-                "header": [],
-                "url": {
-                    "raw": "{{baseUrl}}/api/v1/timeseries/?indicator_codes=WP%2CETa&start_date=2023-01-01T00%3A00%3A00Z&end_date=2023-12-31T23%3A59%3A59Z&reporting_unit_ids=1%2C2%2C3",
-                    "host": ["{{baseUrl}}"],
-                    "path": ["api", "v1", "timeseries", ""],
-                    "query": [
-                        {
-                            "key": "indicator_codes", "value": "WP,ETa",
-                            "description": "Comma-separated list of indicator codes."
-                        },
-                        {
-                            "key": "start_date", "value": "2023-01-01T00:00:00Z",
-                            "description": "ISO format datetime string"
-                        },
-                        {
-                            "key": "end_date", "value": "2023-12-31T23:59:59Z",
-                            "description": "ISO format datetime string"
-                        },
-                        {
-                            "key": "reporting_unit_ids", "value": "1,2,3",
-                            "description": "Comma-separated list of reporting unit IDs (optional, but either this or infrastructure_ids is required)",
-                            "disabled": False
-                        },
-                        {
-                            "key": "infrastructure_ids", "value": "10,11",
-                            "description": "Comma-separated list of infrastructure unit IDs (optional, but either this or reporting_unit_ids is required)",
-                            "disabled": True
-                        },
-                        {
-                            "key": "temporal_resolution_name", "value": "Daily",
-                            "description": "(string, optional)", "disabled": True
-                        },
-                        {
-                            "key": "aggregate_to", "value": "Monthly",
-                            "description": "(string, optional)", "disabled": True
-                        }
-                    ]
-                },
-                "description": "Retrieve time-series data for specified indicators and locations/units. Requires authentication. Either reporting_unit_ids or infrastructure_ids must be provided."
-            },
-            "response": []
-        }
+        _get_request(
+            "Get Time Series Data",
+            _url(
+                "api", "v1", "timeseries", "",
+                query=[
+                    {
+                        "key": "indicator_codes", "value": "WP,ETa",
+                        "description": "Comma-separated list of indicator codes."
+                    },
+                    {
+                        "key": "start_date", "value": "2023-01-01T00:00:00Z",
+                        "description": "ISO format datetime string"
+                    },
+                    {
+                        "key": "end_date", "value": "2023-12-31T23:59:59Z",
+                        "description": "ISO format datetime string"
+                    },
+                    {
+                        "key": "reporting_unit_ids", "value": "1,2,3",
+                        "description": "Comma-separated list of reporting unit IDs (optional, but either this or infrastructure_ids is required)",
+                        "disabled": False
+                    },
+                    {
+                        "key": "infrastructure_ids", "value": "10,11",
+                        "description": "Comma-separated list of infrastructure unit IDs (optional, but either this or reporting_unit_ids is required)",
+                        "disabled": True
+                    },
+                    {
+                        "key": "temporal_resolution_name", "value": "Daily",
+                        "description": "(string, optional)", "disabled": True
+                    },
+                    {
+                        "key": "aggregate_to", "value": "Monthly",
+                        "description": "(string, optional)", "disabled": True
+                    }
+                ]
+            ),
+            "Retrieve time-series data for specified indicators and locations/units. Requires authentication. Either reporting_unit_ids or infrastructure_ids must be provided."
+        )
     ]
 }
 collection["item"].append(time_series_data_folder)
@@ -364,54 +307,47 @@ collection["item"].append(time_series_data_folder)
 summary_data_folder = {
     "name": "Summary Data",
     "item": [
-        {
-            "name": "Get Summary Statistics",
-            "request": {
-                "method": "GET",
-                "header": [],
-                "url": {
-                    "raw": "{{baseUrl}}/api/v1/summary-data/?indicator_codes=WP%2CETa&time_period_start=2023-01-01T00%3A00%3A00Z&time_period_end=2023-12-31T23%3A59%3A59Z&aggregation_method=Average",
-                    "host": ["{{baseUrl}}"],
-                    "path": ["api", "v1", "summary-data", ""],
-                    "query": [
-                        {
-                            "key": "indicator_codes",
-                            "value": "WP,ETa",
-                            "description": "Comma-separated list of indicator codes."
-                        },
-                        {
-                            "key": "time_period_start",
-                            "value": "2023-01-01T00:00:00Z",
-                            "description": "ISO format datetime string for the start of the period."
-                        },
-                        {
-                            "key": "time_period_end",
-                            "value": "2023-12-31T23:59:59Z",
-                            "description": "ISO format datetime string for the end of the period."
-                        },
-                        {
-                            "key": "reporting_unit_ids",
-                            "value": "1,2,3",
-                            "description": "Comma-separated list of reporting unit IDs.",
-                            "disabled": True
-                        },
-                        {
-                            "key": "infrastructure_ids",
-                            "value": "10,11",
-                            "description": "Comma-separated list of infrastructure IDs.",
-                            "disabled": True
-                        },
-                        {
-                            "key": "aggregation_method",
-                            "value": "Average",
-                            "description": "Method for aggregation (e.g., 'Average', 'Sum', 'Min', 'Max', 'Count')."
-                        }
-                    ]
-                },
-                "description": "Retrieve aggregated/summary data for comparisons or KPIs. Requires authentication."
-            },
-            "response": []
-        }
+        _get_request(
+            "Get Summary Statistics",
+            _url(
+                "api", "v1", "summary-data", "",
+                query=[
+                    {
+                        "key": "indicator_codes",
+                        "value": "WP,ETa",
+                        "description": "Comma-separated list of indicator codes."
+                    },
+                    {
+                        "key": "time_period_start",
+                        "value": "2023-01-01T00:00:00Z",
+                        "description": "ISO format datetime string for the start of the period."
+                    },
+                    {
+                        "key": "time_period_end",
+                        "value": "2023-12-31T23:59:59Z",
+                        "description": "ISO format datetime string for the end of the period."
+                    },
+                    {
+                        "key": "reporting_unit_ids",
+                        "value": "1,2,3",
+                        "description": "Comma-separated list of reporting unit IDs.",
+                        "disabled": True
+                    },
+                    {
+                        "key": "infrastructure_ids",
+                        "value": "10,11",
+                        "description": "Comma-separated list of infrastructure IDs.",
+                        "disabled": True
+                    },
+                    {
+                        "key": "aggregation_method",
+                        "value": "Average",
+                        "description": "Method for aggregation (e.g., 'Average', 'Sum', 'Min', 'Max', 'Count')."
+                    }
+                ]
+            ),
+            "Retrieve aggregated/summary data for comparisons or KPIs. Requires authentication."
+        )
     ]
 }
 collection["item"].append(summary_data_folder)
@@ -430,54 +366,38 @@ uom_categories_folder = {
                     "raw": json.dumps({"name": "Temperature"}, indent=4),
                     "options": {"raw": {"language": "json"}}
                 },
-                "url": {
-                    "raw": "{{baseUrl}}/api/v1/unit-of-measurement-categories/",
-                    "host": ["{{baseUrl}}"],
-                    "path": ["api", "v1", "unit-of-measurement-categories", ""]
-                },
+                "url": _url("api", "v1", "unit-of-measurement-categories", ""),
                 "description": "Create a new unit of measurement category. Requires authentication."
             },
             "response": []
         },
-        {
-            "name": "List Unit of Measurement Categories",
-            "request": {
-                "method": "GET",
-                "header": [],
-                "url": {
-                    "raw": "{{baseUrl}}/api/v1/unit-of-measurement-categories/?skip=0&limit=100",
-                    "host": ["{{baseUrl}}"],
-                    "path": ["api", "v1", "unit-of-measurement-categories", ""],
-                    "query": [
-                        {"key": "skip", "value": "0", "description": "Number of records to skip"},
-                        {"key": "limit", "value": "100", "description": "Maximum number of records"}
-                    ]
-                },
-                "description": "Retrieve a list of unit of measurement categories."
-            },
-            "response": []
-        },
-        {
-            "name": "Get Unit of Measurement Category by ID",
-            "request": {
-                "method": "GET",
-                "header": [],
-                "url": {
-                    "raw": "{{baseUrl}}/api/v1/unit-of-measurement-categories/{{uom_category_id}}",
-                    "host": ["{{baseUrl}}"],
-                    "path": ["api", "v1", "unit-of-measurement-categories", "{{uom_category_id}}"],
-                    "variable": [{"key": "uom_category_id", "value": "1", "description": "(integer)"}]
-                },
-                "description": "Retrieve a specific unit of measurement category by its ID."
-            },
-            "response": []
-        }
+        _get_request(
+            "List Unit of Measurement Categories",
+            _url(
+                "api", "v1", "unit-of-measurement-categories", "",
+                query=[
+                    {"key": "skip", "value": "0", "description": "Number of records to skip"},
+                    {"key": "limit", "value": "100", "description": "Maximum number of records"}
+                ]
+            ),
+            "Retrieve a list of unit of measurement categories."
+        ),
+        _get_request(
+            "Get Unit of Measurement Category by ID",
+            _url(
+                "api", "v1", "unit-of-measurement-categories", "{{uom_category_id}}",
+                variable=[{"key": "uom_category_id", "value": "1", "description": "(integer)"}]
+            ),
+            "Retrieve a specific unit of measurement category by its ID."
+        )
     ]
 }
 collection["item"].append(uom_categories_folder)
 
 
-with open("postman_collection.json", "w") as f:
-    json.dump(collection, f, indent=4)
+# orjson only supports 2-space indentation; the embedded "raw" bodies above keep
+# stdlib json.dumps so their 4-space formatting is preserved.
+collection_json = orjson.dumps(collection, option=orjson.OPT_INDENT_2)
+Path("postman_collection.json").write_bytes(collection_json)
 
 print("Postman collection generated successfully with summary_data folder: postman_collection.json")
@@ -4,10 +4,18 @@ import multiprocessing
 bind = "0.0.0.0:8000"  # Listen on all network interfaces, port 8000
 
 # Worker processes
-workers = multiprocessing.cpu_count() * 2 + 1  # Optimal for CPU-bound apps
-worker_class = "uvicorn.workers.UvicornWorker"  # Required for FastAPI (ASGI)
+# Each Uvicorn worker runs an asyncio event loop that serves many concurrent requests, so the
+# sync-worker "2 * cpu + 1" rule over-provisions: one worker per core is enough for an I/O-bound app.
+workers = max(2, multiprocessing.cpu_count())
+# UvicornWorker (required for FastAPI/ASGI; uses uvloop + httptools from uvicorn[standard])
+# capped at 1000 concurrent connections per worker, see app/core/uvicorn_worker.py
+worker_class = "app.core.uvicorn_worker.LimitedUvicornWorker"
 timeout = 120  # Kill workers after 120s if they hang
-keepalive = 5  # Keep-alive connections for 5s
+keepalive = 75  # Longer than the typical 60s idle timeout of an upstream proxy (nginx/ALB)
+worker_tmp_dir = "/dev/shm"  # Heartbeat files on tmpfs, not the container's disk-backed /tmp
+max_requests = 1000  # Recycle workers periodically to bound memory growth
+max_requests_jitter = 100  # Stagger recycling so workers don't restart together
+backlog = 2048  # Pending connections to queue during spikes and rolling deploys
 
 # Logging
 accesslog = "-"  # Log to stdout (useful for Docker)
@@ -0,0 +1,60 @@
+from typing import Iterator
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.database.models import UnitOfMeasurement, UnitOfMeasurementCategory
+from app.database.models.base_model import Base as SQLAlchemyBase
+
+# The model tests are synchronous and only need these tables
+MODEL_TEST_TABLES = [UnitOfMeasurementCategory.__table__, UnitOfMeasurement.__table__]
+
+
+@pytest.fixture(scope="session")
+def sqlite_engine() -> Iterator[Engine]:
+    """
+    One in-memory SQLite database shared by all model tests; the schema is created once.
+    StaticPool keeps the single connection (and so the database) alive for the session.
+    """
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        # SQLite only enforces FOREIGN KEY constraints when asked to, once per connection
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _on_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    SQLAlchemyBase.metadata.create_all(engine, tables=MODEL_TEST_TABLES)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def db_session(sqlite_engine: Engine) -> Iterator[Session]:
+    """
+    Synchronous session for model tests (overrides the async db_session in tests/conftest.py).
+    Runs inside an outer transaction that is rolled back on teardown; commits and rollbacks
+    made by a test only act on a SAVEPOINT.
+    """
+    with sqlite_engine.connect() as connection:
+        transaction = connection.begin()
+        session = Session(bind=connection, join_transaction_mode="create_savepoint")
+        try:
+            yield session
+        finally:
+            session.close()
+            transaction.rollback()
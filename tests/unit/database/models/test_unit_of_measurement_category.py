@@ -26,8 +26,7 @@ def test_create_unit_of_measurement_category(db_session: Session):
     category = UnitOfMeasurementCategory(name=category_name)
 
     db_session.add(category)
-    db_session.commit()
-    db_session.refresh(category)
+    db_session.flush()
 
     assert category.id is not None
     assert category.name == category_name
@@ -39,25 +38,24 @@ def test_uom_category_name_not_nullable(db_session: Session):
     with pytest.raises(IntegrityError):
         category = UnitOfMeasurementCategory(name=None)
         db_session.add(category)
-        db_session.commit() # IntegrityError for NOT NULL is usually raised on commit
+        db_session.flush() # IntegrityError for NOT NULL is raised when the INSERT is flushed
 
 def test_uom_category_name_unique(db_session: Session):
     """Test that the name field is unique."""
     category_name = "Length"
     category1 = UnitOfMeasurementCategory(name=category_name)
     db_session.add(category1)
-    db_session.commit()
+    db_session.flush()
 
     with pytest.raises(IntegrityError):
         category2 = UnitOfMeasurementCategory(name=category_name)
         db_session.add(category2)
-        db_session.commit() # IntegrityError for UNIQUE is usually raised on commit
+        db_session.flush() # IntegrityError for UNIQUE is raised when the INSERT is flushed
 
 # Example of how one might test __repr__ more specifically if needed
 def test_uom_category_repr(db_session: Session):
     category = UnitOfMeasurementCategory(name="Volume")
     db_session.add(category)
-    db_session.commit()
-    db_session.refresh(category)
+    db_session.flush()
     expected_repr = f"<UnitOfMeasurementCategory(id={category.id}, name='Volume')>"
     assert repr(category) == expected_repr
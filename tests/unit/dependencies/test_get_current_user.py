@@ -0,0 +1,46 @@
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.models.permission import Permission
+from app.database.models.role import Role
+from app.database.models.user import User
+from app.dependencies.get_current_user import get_current_user, get_optional_current_user
+from app.security.token_utils import create_access_token
+from tests.unit.services.test_user_service_eager_loading import count_queries
+
+EMAIL = "current_user_eager@example.com"
+
+
+@pytest.fixture
+async def user_with_permissions(db_session: AsyncSession) -> str:
+    """Adds an active user with two roles, each holding two permissions; returns a token for them."""
+    roles = [
+        Role(
+            name=f"current_user_role_{i}",
+            permissions=[Permission(name=f"current_user_perm_{i}_{j}") for j in range(2)],
+        )
+        for i in range(2)
+    ]
+    db_session.add(
+        User(email=EMAIL, username="current_user_eager", hashed_password="not-a-real-hash", roles=roles)
+    )
+    await db_session.flush()
+    db_session.expunge_all()  # Make the dependency load everything from the database again
+    return create_access_token(subject=EMAIL)
+
+
+@pytest.mark.parametrize("dependency", [get_current_user, get_optional_current_user])
+async def test_current_user_loads_roles_and_permissions_in_one_query(
+    db_session: AsyncSession, user_with_permissions: str, dependency
+):
+    with count_queries(db_session.bind.engine) as statements:
+        user = await dependency(token=user_with_permissions, db=db_session)
+
+    assert user is not None and user.email == EMAIL
+    # User, roles and permissions come from one JOINed SELECT; selectinload would be 3, lazy loads more
+    assert len(statements) == 1, statements
+    assert sorted(role.name for role in user.roles) == ["current_user_role_0", "current_user_role_1"]
+    for role in user.roles:
+        assert "permissions" not in inspect(role).unloaded
+        assert len(role.permissions) == 2
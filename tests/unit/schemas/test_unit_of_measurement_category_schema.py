@@ -19,7 +19,7 @@ def test_uom_category_base_missing_name():
     """Test UnitOfMeasurementCategoryBase with missing name."""
     with pytest.raises(ValidationError) as exc_info:
         UnitOfMeasurementCategoryBase() # name is required
-    assert "name" in str(exc_info.value)
+    assert any(error["loc"] == ("name",) for error in exc_info.value.errors())
 
 def test_uom_category_create_valid():
     """Test UnitOfMeasurementCategoryCreate with valid data."""
@@ -31,7 +31,7 @@ def test_uom_category_create_missing_name():
     """Test UnitOfMeasurementCategoryCreate with missing name."""
     with pytest.raises(ValidationError) as exc_info:
         UnitOfMeasurementCategoryCreate() # name is required
-    assert "name" in str(exc_info.value)
+    assert any(error["loc"] == ("name",) for error in exc_info.value.errors())
 
 def test_uom_category_read_schema_from_orm():
     """Test UnitOfMeasurementCategory (read schema) conversion from ORM model."""
@@ -63,31 +63,17 @@ def test_uom_category_base_extra_fields():
     assert not hasattr(schema, "extra_field")
 
 def test_uom_category_read_schema_data_integrity():
-    """Test UnitOfMeasurementCategory with various data types for id."""
-    # Valid: id is int
+    """Test UnitOfMeasurementCategory keeps the id read from the ORM model."""
     orm_model_valid = UnitOfMeasurementCategoryModel(id=10, name="Energy")
     schema_valid = UnitOfMeasurementCategory.model_validate(orm_model_valid)
     assert schema_valid.id == 10
 
-    # Invalid: id is string (Pydantic should try to coerce or fail if strict)
-    # If your model's id is strictly int, this might pass due to coercion.
-    # For testing strictness, you might need a strict version of the schema.
-    # This test depends on whether 'id: int' in Pydantic coerces "20" to 20.
-    # Pydantic v2 generally coerces.
-    data_with_str_id = {"id": "20", "name": "Power"}
-    schema_coerced = UnitOfMeasurementCategory(**data_with_str_id)
-    assert schema_coerced.id == 20
-
-    # Invalid: id is None (if not Optional)
-    # The 'id: int' field in UnitOfMeasurementCategory is not Optional.
+@pytest.mark.parametrize("kwargs, missing_field", [({"name": "Frequency"}, "id"), ({"id": 1}, "name")])
+def test_uom_category_read_schema_required_fields(kwargs, missing_field):
+    """Test that both 'id' and 'name' are required on the read schema."""
     with pytest.raises(ValidationError) as exc_info:
-        UnitOfMeasurementCategory(id=None, name="Frequency")
-    assert "id" in str(exc_info.value).lower() # Check that 'id' field is mentioned in the error
-    assert "none is not an allowed value" in str(exc_info.value).lower() or "type_error.integer" in str(exc_info.value).lower()
-
-    with pytest.raises(ValidationError) as exc_info_name:
-        UnitOfMeasurementCategory(id=1, name=None) # name is also not Optional
-    assert "name" in str(exc_info_name.value).lower()
+        UnitOfMeasurementCategory(**kwargs)
+    assert [error["loc"] for error in exc_info.value.errors()] == [(missing_field,)]
 
 # Ensure from_attributes (or orm_mode) is True in the schema for from_orm/model_validate to work
 def test_uom_category_config():
@@ -1,5 +1,7 @@
 import pytest
+from datetime import datetime
 from pydantic import ValidationError
+from types import SimpleNamespace
 from typing import Optional # Required for Optional type hints in tests if not globally available
 
 from app.schemas.unit_of_measurement import (
@@ -12,73 +14,71 @@ from app.schemas.unit_of_measurement_category import UnitOfMeasurementCategory a
 from app.database.models import UnitOfMeasurement as UnitOfMeasurementModel
 from app.database.models import UnitOfMeasurementCategory as UnitOfMeasurementCategoryModel
 
-# Helper to create a category model instance
-def _create_category_model(id: int, name: str) -> UnitOfMeasurementCategoryModel:
-    return UnitOfMeasurementCategoryModel(id=id, name=name)
+# Timestamps the database would have filled in for a persisted row
+_TIMESTAMP = datetime(2025, 1, 1, 12, 0, 0)
 
-# Helper to create a UoM model instance
+# The read schemas only getattr() their fields (from_attributes=True), so plain attribute
+# bags stand in for ORM instances without the mapper instrumentation.
+# test_uom_read_from_real_orm_model covers the real model.
+
+# Helper to create a category row stand-in
+def _create_category_model(id: int, name: str) -> SimpleNamespace:
+    return SimpleNamespace(id=id, name=name, created_at=_TIMESTAMP, updated_at=_TIMESTAMP)
+
+# Helper to create a UoM row stand-in
 def _create_uom_model(
     id: int,
     name: str,
     abbreviation: str,
-    category_model: Optional[UnitOfMeasurementCategoryModel] = None,
+    category_model: Optional[SimpleNamespace] = None,
     description: Optional[str] = None
-) -> UnitOfMeasurementModel:
-    uom = UnitOfMeasurementModel(
+) -> SimpleNamespace:
+    return SimpleNamespace(
         id=id,
         name=name,
         abbreviation=abbreviation,
-        description=description
+        description=description,
+        category_id=category_model.id if category_model else None,
+        category=category_model,
+        created_at=_TIMESTAMP,
+        updated_at=_TIMESTAMP,
     )
-    if category_model:
-        uom.category = category_model # This also sets category_id if relationships are set up
-        uom.category_id = category_model.id
-    return uom
-
-# --- UnitOfMeasurementBase Tests ---
-def test_uom_base_valid_data():
-    data = {"name": "Meter", "abbreviation": "m"}
-    schema = UnitOfMeasurementBase(**data)
-    assert schema.name == data["name"]
-    assert schema.abbreviation == data["abbreviation"]
-    assert schema.category_id is None # Default
-
-def test_uom_base_with_category_id():
-    data = {"name": "Kilogram", "abbreviation": "kg", "category_id": 1}
-    schema = UnitOfMeasurementBase(**data)
-    assert schema.name == data["name"]
-    assert schema.abbreviation == data["abbreviation"]
-    assert schema.category_id == 1
-
-def test_uom_base_category_id_none():
-    data = {"name": "Watt", "abbreviation": "W", "category_id": None}
-    schema = UnitOfMeasurementBase(**data)
-    assert schema.category_id is None
-
-def test_uom_base_missing_required_fields():
-    with pytest.raises(ValidationError):
-        UnitOfMeasurementBase(name="OnlyName") # Abbreviation missing
-    with pytest.raises(ValidationError):
-        UnitOfMeasurementBase(abbreviation="OnlyAbbr") # Name missing
-
-# --- UnitOfMeasurementCreate Tests ---
-def test_uom_create_valid_data():
-    data = {"name": "Second", "abbreviation": "s", "description": "Time unit"}
-    schema = UnitOfMeasurementCreate(**data)
-    assert schema.name == data["name"]
-    assert schema.abbreviation == data["abbreviation"]
-    assert schema.description == data["description"]
-    assert schema.category_id is None
 
-def test_uom_create_with_category_id():
-    data = {"name": "Ampere", "abbreviation": "A", "category_id": 2}
-    schema = UnitOfMeasurementCreate(**data)
-    assert schema.category_id == 2
-
-def test_uom_create_category_id_invalid_type():
-    with pytest.raises(ValidationError):
-        # category_id should be int
-        UnitOfMeasurementCreate(name="Volt", abbreviation="V", category_id="not-an-int")
+# --- UnitOfMeasurementBase / UnitOfMeasurementCreate Tests ---
+# (schema, input, expected): expected is either the field values the schema should end up
+# with, or the exception validating the input must raise.
+SCHEMA_CASES = [
+    pytest.param(UnitOfMeasurementBase, {"name": "Meter", "abbreviation": "m"},
+                 {"name": "Meter", "abbreviation": "m", "category_id": None}, id="base-valid"),
+    pytest.param(UnitOfMeasurementBase, {"name": "Kilogram", "abbreviation": "kg", "category_id": 1},
+                 {"name": "Kilogram", "abbreviation": "kg", "category_id": 1}, id="base-with-category-id"),
+    pytest.param(UnitOfMeasurementBase, {"name": "Watt", "abbreviation": "W", "category_id": None},
+                 {"category_id": None}, id="base-category-id-none"),
+    pytest.param(UnitOfMeasurementBase, {"name": "OnlyName"}, ValidationError, id="base-missing-abbreviation"),
+    pytest.param(UnitOfMeasurementBase, {"abbreviation": "OnlyAbbr"}, ValidationError, id="base-missing-name"),
+    pytest.param(UnitOfMeasurementCreate, {"name": "Second", "abbreviation": "s", "description": "Time unit"},
+                 {"name": "Second", "abbreviation": "s", "description": "Time unit", "category_id": None},
+                 id="create-valid"),
+    pytest.param(UnitOfMeasurementCreate, {"name": "Ampere", "abbreviation": "A", "category_id": 2},
+                 {"category_id": 2}, id="create-with-category-id"),
+    pytest.param(UnitOfMeasurementCreate, {"name": "Volt", "abbreviation": "V", "category_id": "not-an-int"},
+                 ValidationError, id="create-category-id-invalid-type"),
+    pytest.param(UnitOfMeasurementCreate, {"name": "Candela", "abbreviation": "cd"},
+                 {"name": "Candela", "category_id": None}, id="create-category-id-optional"),
+    pytest.param(UnitOfMeasurementCreate, {"name": "Mole", "abbreviation": "mol", "category_id": None},
+                 {"name": "Mole", "category_id": None}, id="create-category-id-none"),
+]
+
+@pytest.mark.parametrize("schema_cls, data, expected", SCHEMA_CASES)
+def test_uom_input_schema_cases(schema_cls, data, expected):
+    if isinstance(expected, type) and issubclass(expected, Exception):
+        with pytest.raises(expected):
+            schema_cls(**data)
+        return
+
+    schema = schema_cls(**data)
+    for field, value in expected.items():
+        assert getattr(schema, field) == value
 
 # --- UnitOfMeasurement (Read Schema) Tests ---
 def test_uom_read_from_orm_without_category():
@@ -112,6 +112,25 @@ def test_uom_read_from_orm_with_category():
     assert schema.category.id == orm_category.id
     assert schema.category.name == orm_category.name
 
+def test_uom_read_from_real_orm_model():
+    """Test conversion through the real SQLAlchemy model's instrumented attributes."""
+    orm_category = UnitOfMeasurementCategoryModel(
+        id=11, name="Pressure Units", created_at=_TIMESTAMP, updated_at=_TIMESTAMP
+    )
+    orm_uom = UnitOfMeasurementModel(
+        id=3, name="Pascal", abbreviation="Pa", category=orm_category,
+        created_at=_TIMESTAMP, updated_at=_TIMESTAMP
+    )
+    orm_uom.category_id = orm_category.id
+
+    schema = UnitOfMeasurement.model_validate(orm_uom)
+
+    assert schema.id == orm_uom.id
+    assert schema.abbreviation == "Pa"
+    assert schema.category_id == orm_category.id
+    assert schema.category.name == orm_category.name
+    assert schema.created_at == _TIMESTAMP
+
 def test_uom_read_schema_ensure_config_from_attributes():
     assert UnitOfMeasurement.model_config.get('from_attributes') is True, \
         "UnitOfMeasurement schema must have from_attributes=True in its Config"
@@ -134,15 +153,3 @@ def test_uom_update_all_fields_optional():
     data_partial_cat_id = {"category_id": 5}
     schema_partial_cat = UnitOfMeasurementUpdate(**data_partial_cat_id)
     assert schema_partial_cat.category_id == 5
-
-# Test that category_id on create schema is indeed optional
-def test_uom_create_category_id_is_optional():
-    data = {"name": "Candela", "abbreviation": "cd"} # No category_id
-    schema = UnitOfMeasurementCreate(**data)
-    assert schema.name == "Candela"
-    assert schema.category_id is None
-
-    data_with_none = {"name": "Mole", "abbreviation": "mol", "category_id": None}
-    schema_with_none = UnitOfMeasurementCreate(**data_with_none)
-    assert schema_with_none.name == "Mole"
-    assert schema_with_none.category_id is None
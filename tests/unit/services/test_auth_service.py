@@ -1,22 +1,56 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Callable
+from unittest.mock import AsyncMock, MagicMock
 
 from app.services.auth_service import AuthService
 from app.services.user_service import UserService # To mock this dependency
 from app.database.models.user import User as UserModel # SQLAlchemy model
 from app.security.hashing import Hasher # To mock Hasher.verify_password
 
-# pytestmark = pytest.mark.asyncio # Apply to all tests in this module
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_user_service() -> AsyncMock:
-    """Fixture to create a mock UserService."""
+    """
+    Fixture to create a mock UserService. Built once per module (spec= introspects
+    UserService on every construction); _reset_mock_user_service clears it between tests.
+    """
     service = AsyncMock(spec=UserService)
     service.get_user_by_email = AsyncMock()
     service.get_user_by_username = AsyncMock()
     return service
 
+@pytest.fixture(autouse=True)
+def _reset_mock_user_service(mock_user_service: AsyncMock):
+    """Fixture giving each test a clean mock: call history, return values and side effects."""
+    yield
+    mock_user_service.reset_mock(return_value=True, side_effect=True)
+
+@pytest.fixture
+def make_user() -> Callable[..., MagicMock]:
+    """
+    Factory for stand-in users: spec=UserModel keeps attribute names honest (typos fail)
+    without going through the mapped class's instrumented __init__.
+    """
+    def _make_user(**overrides) -> MagicMock:
+        attributes = {
+            "id": 1,
+            "email": "test@example.com",
+            "username": "testuser",
+            "hashed_password": "hashed_pw",
+            "is_active": True,
+            **overrides,
+        }
+        return MagicMock(spec=UserModel, **attributes)
+    return _make_user
+
 @pytest.fixture
+def mock_verify_password(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Fixture replacing Hasher.verify_password with a mock (accepts by default) for one test."""
+    mock = MagicMock(return_value=True)
+    monkeypatch.setattr(Hasher, "verify_password", mock)
+    return mock
+
+@pytest.fixture(scope="module")
 def auth_service(mock_user_service: AsyncMock) -> AuthService:
     """Fixture to create an AuthService instance with a mock UserService."""
     # AuthService typically takes a db_session, but its methods use self.user_service.
@@ -31,73 +65,66 @@ def auth_service(mock_user_service: AsyncMock) -> AuthService:
     auth_service_instance.user_service = mock_user_service 
     return auth_service_instance
 
-@pytest.mark.asyncio
-@patch("app.security.hashing.Hasher.verify_password")
-async def test_authenticate_user_with_email_success(
-    mock_verify_password: MagicMock,
-    auth_service: AuthService, 
-    mock_user_service: AsyncMock
-):
-    # Arrange
-    test_email = "test@example.com"
-    test_password = "correct_password"
-    mock_user = UserModel(id=1, email=test_email, username="testuser", hashed_password="hashed_pw", is_active=True)
-    
-    mock_user_service.get_user_by_email.return_value = mock_user
-    mock_user_service.get_user_by_username.return_value = None # Should not be called
-    mock_verify_password.return_value = True
-
-    # Act
-    authenticated_user = await auth_service.authenticate_user(login_identifier=test_email, password=test_password)
-
-    # Assert
-    mock_user_service.get_user_by_email.assert_called_once_with(email=test_email)
-    mock_user_service.get_user_by_username.assert_not_called()
-    mock_verify_password.assert_called_once_with(test_password, mock_user.hashed_password)
-    assert authenticated_user is not None
-    assert authenticated_user == mock_user
-
-@pytest.mark.asyncio
-@patch("app.security.hashing.Hasher.verify_password")
-async def test_authenticate_user_with_username_success(
-    mock_verify_password: MagicMock,
+@pytest.mark.parametrize(
+    "login_identifier, by_email, password_ok, is_active, expected_ok",
+    [
+        pytest.param("test@example.com", True, True, True, True, id="email-success"),
+        pytest.param("testuser", False, True, True, True, id="username-success"),
+        pytest.param("testuser", False, False, True, False, id="username-wrong-password"),
+        pytest.param("test@example.com", True, False, True, False, id="email-wrong-password"),
+        # Password is verified before the active check
+        pytest.param("inactiveuser", False, True, False, False, id="username-inactive"),
+        pytest.param("inactive@example.com", True, True, False, False, id="email-inactive"),
+    ],
+)
+async def test_authenticate_user(
     auth_service: AuthService,
-    mock_user_service: AsyncMock
+    mock_user_service: AsyncMock,
+    mock_verify_password: MagicMock,
+    make_user: Callable[..., MagicMock],
+    login_identifier: str,
+    by_email: bool,
+    password_ok: bool,
+    is_active: bool,
+    expected_ok: bool
 ):
     # Arrange
-    test_username = "testuser"
-    test_password = "correct_password"
-    mock_user = UserModel(id=1, email="test@example.com", username=test_username, hashed_password="hashed_pw", is_active=True)
+    test_password = "some_password"
+    mock_user = make_user(is_active=is_active)
 
     # Logic in auth_service: if "@" in login_identifier, try email. Otherwise, skip email.
-    # For test_username = "testuser", email check is skipped.
-    mock_user_service.get_user_by_email.return_value = None 
-    mock_user_service.get_user_by_username.return_value = mock_user
-    mock_verify_password.return_value = True
-    
+    mock_user_service.get_user_by_email.return_value = mock_user if by_email else None
+    mock_user_service.get_user_by_username.return_value = None if by_email else mock_user
+    mock_verify_password.return_value = password_ok
+
     # Act
-    authenticated_user = await auth_service.authenticate_user(login_identifier=test_username, password=test_password)
+    authenticated_user = await auth_service.authenticate_user(login_identifier=login_identifier, password=test_password)
 
     # Assert
-    mock_user_service.get_user_by_email.assert_not_called() # Because "testuser" does not contain "@"
-    mock_user_service.get_user_by_username.assert_called_once_with(username=test_username)
+    if by_email:
+        mock_user_service.get_user_by_email.assert_called_once_with(email=login_identifier)
+        mock_user_service.get_user_by_username.assert_not_called()
+    else:
+        mock_user_service.get_user_by_email.assert_not_called() # No "@" in the identifier
+        mock_user_service.get_user_by_username.assert_called_once_with(username=login_identifier)
     mock_verify_password.assert_called_once_with(test_password, mock_user.hashed_password)
-    assert authenticated_user is not None
-    assert authenticated_user == mock_user
+    if expected_ok:
+        assert authenticated_user == mock_user
+    else:
+        assert authenticated_user is None
 
-@pytest.mark.asyncio
-@patch("app.security.hashing.Hasher.verify_password")
 async def test_authenticate_user_with_username_if_email_fails(
-    mock_verify_password: MagicMock,
     auth_service: AuthService,
-    mock_user_service: AsyncMock
+    mock_user_service: AsyncMock,
+    mock_verify_password: MagicMock,
+    make_user: Callable[..., MagicMock]
 ):
     # Arrange
     # This tests the case where login_identifier looks like an email, but no user is found by email
     test_login_identifier_like_email = "user_not_by_email@example.com"
     test_username_fallback = "user_not_by_email" # assume this is the username of the user
     test_password = "correct_password"
-    mock_user = UserModel(id=1, email=test_login_identifier_like_email, username=test_username_fallback, hashed_password="hashed_pw", is_active=True)
+    mock_user = make_user(email=test_login_identifier_like_email, username=test_username_fallback)
 
     mock_user_service.get_user_by_email.return_value = None # Email lookup fails
     mock_user_service.get_user_by_username.return_value = mock_user # Username lookup succeeds
@@ -119,54 +146,6 @@ async def test_authenticate_user_with_username_if_email_fails(
     assert authenticated_user == mock_user
 
 
-@pytest.mark.asyncio
-@patch("app.security.hashing.Hasher.verify_password")
-async def test_authenticate_user_with_username_wrong_password(
-    mock_verify_password: MagicMock,
-    auth_service: AuthService,
-    mock_user_service: AsyncMock
-):
-    # Arrange
-    test_username = "testuser"
-    test_password = "wrong_password"
-    mock_user = UserModel(id=1, email="test@example.com", username=test_username, hashed_password="hashed_pw", is_active=True)
-
-    mock_user_service.get_user_by_email.return_value = None
-    mock_user_service.get_user_by_username.return_value = mock_user
-    mock_verify_password.return_value = False # Simulate wrong password
-
-    # Act
-    authenticated_user = await auth_service.authenticate_user(login_identifier=test_username, password=test_password)
-
-    # Assert
-    mock_user_service.get_user_by_username.assert_called_once_with(username=test_username)
-    mock_verify_password.assert_called_once_with(test_password, mock_user.hashed_password)
-    assert authenticated_user is None
-
-@pytest.mark.asyncio
-@patch("app.security.hashing.Hasher.verify_password")
-async def test_authenticate_user_with_email_wrong_password(
-    mock_verify_password: MagicMock,
-    auth_service: AuthService,
-    mock_user_service: AsyncMock
-):
-    # Arrange
-    test_email = "test@example.com"
-    test_password = "wrong_password"
-    mock_user = UserModel(id=1, email=test_email, username="testuser", hashed_password="hashed_pw", is_active=True)
-
-    mock_user_service.get_user_by_email.return_value = mock_user
-    mock_verify_password.return_value = False # Simulate wrong password
-
-    # Act
-    authenticated_user = await auth_service.authenticate_user(login_identifier=test_email, password=test_password)
-
-    # Assert
-    mock_user_service.get_user_by_email.assert_called_once_with(email=test_email)
-    mock_verify_password.assert_called_once_with(test_password, mock_user.hashed_password)
-    assert authenticated_user is None
-
-@pytest.mark.asyncio
 async def test_authenticate_user_not_found(
     auth_service: AuthService,
     mock_user_service: AsyncMock
@@ -200,52 +179,3 @@ async def test_authenticate_user_not_found(
     mock_user_service.get_user_by_username.assert_called_once_with(username=test_identifier_plain)
     assert authenticated_user_plain is None
 
-
-@pytest.mark.asyncio
-@patch("app.security.hashing.Hasher.verify_password")
-async def test_authenticate_user_inactive_with_username(
-    mock_verify_password: MagicMock,
-    auth_service: AuthService,
-    mock_user_service: AsyncMock
-):
-    # Arrange
-    test_username = "inactiveuser"
-    test_password = "correct_password" 
-    mock_user = UserModel(id=1, email="inactive@example.com", username=test_username, hashed_password="hashed_pw", is_active=False)
-
-    mock_user_service.get_user_by_email.return_value = None
-    mock_user_service.get_user_by_username.return_value = mock_user
-    mock_verify_password.return_value = True # Assume password would be correct
-
-    # Act
-    authenticated_user = await auth_service.authenticate_user(login_identifier=test_username, password=test_password)
-
-    # Assert
-    mock_user_service.get_user_by_username.assert_called_once_with(username=test_username)
-    mock_verify_password.assert_called_once_with(test_password, mock_user.hashed_password) # Password verified before active check
-    assert authenticated_user is None
-
-@pytest.mark.asyncio
-@patch("app.security.hashing.Hasher.verify_password")
-async def test_authenticate_user_inactive_with_email(
-    mock_verify_password: MagicMock,
-    auth_service: AuthService,
-    mock_user_service: AsyncMock
-):
-    # Arrange
-    test_email = "inactive@example.com"
-    test_password = "correct_password"
-    mock_user = UserModel(id=1, email=test_email, username="inactiveuser", hashed_password="hashed_pw", is_active=False)
-    
-    mock_user_service.get_user_by_email.return_value = mock_user
-    mock_user_service.get_user_by_username.return_value = None # Should not be called
-    mock_verify_password.return_value = True # Assume password would be correct
-
-    # Act
-    authenticated_user = await auth_service.authenticate_user(login_identifier=test_email, password=test_password)
-
-    # Assert
-    mock_user_service.get_user_by_email.assert_called_once_with(email=test_email)
-    mock_user_service.get_user_by_username.assert_not_called()
-    mock_verify_password.assert_called_once_with(test_password, mock_user.hashed_password) # Password verified before active check
-    assert authenticated_user is None
@@ -1,7 +1,8 @@
 import pytest
+from types import SimpleNamespace
+from typing import Iterator, Optional
 from unittest.mock import AsyncMock, MagicMock, patch  # AsyncMock for async methods
 
-from sqlalchemy.ext.asyncio import AsyncSession  # For type hinting
 from sqlalchemy.exc import IntegrityError # Added for duplicate username test
 
 
@@ -12,221 +13,242 @@ from app.schemas.user import UserCreate, UserUpdate
 from app.security.hashing import Hasher  # We'll mock its methods too
 
 
-# pytestmark = pytest.mark.asyncio # Apply to all tests in this module
+# Input schemas shared by the tests: validated once at import; the service only reads them.
+_USER_CREATE_NO_ROLES = UserCreate(
+    email="newuser@example.com",
+    username="genericuser",
+    password="password123",
+    full_name="New User",
+    role_ids=[]  # No roles for simplicity
+)
+_USER_CREATE_WITH_ROLES = UserCreate(
+    email="roleuser@example.com",
+    username="roleuser1",
+    password="password123",
+    role_ids=[10, 11]
+)
+_USER_CREATE_WITH_USERNAME = UserCreate(
+    email="userwithname@example.com",
+    username="testuser",
+    password="password123",
+    full_name="Test User Name",
+    role_ids=[]
+)
+_USER_CREATE_DUPLICATE = UserCreate(
+    email="duplicate@example.com",
+    username="existinguser",
+    password="password123", # UserCreate requires password
+    role_ids=[]
+)
+_USER_UPDATE_PROFILE = UserUpdate(full_name="New Name", email="new@example.com")
+_USER_UPDATE_PASSWORD = UserUpdate(password="new_plain_password")
+_USER_UPDATE_USERNAME = UserUpdate(username="newusername")
+
+# Rows returned by the mocked lookups, built once (the mapped User constructor is instrumented).
+# Read-only: tests that update or deactivate a user build their own instance.
+_MOCK_USER = UserModel(id=1, email="test@example.com", username="founduser", hashed_password="hashed_pw", is_active=True, roles=[])
+# The paginated listing is only checked for identity, so its rows need no real attributes.
+_MOCK_USERS = [MagicMock(spec=UserModel) for _ in range(5)]
+
+
+class _CountingExecute:
+    """
+    Stand-in for AsyncSession.execute: returns return_value and counts calls. Unlike an
+    AsyncMock it does not record call_args, so the Select statements passed in are not kept.
+    """
+
+    def __init__(self) -> None:
+        self.return_value = None
+        self.call_count = 0
+
+    async def __call__(self, *args, **kwargs):
+        self.call_count += 1
+        return self.return_value
+
+    def reset_mock(self, return_value: bool = False, side_effect: bool = False) -> None:
+        """Same signature as Mock.reset_mock, so _FakeSession can reset all its methods alike."""
+        self.call_count = 0
+        if return_value:
+            self.return_value = None
+
+
+class _FakeSession:
+    """
+    Stand-in for AsyncSession with only the methods UserService calls; much cheaper to
+    build than AsyncMock(spec=AsyncSession), and unknown attributes still raise.
+    """
+
+    def __init__(self) -> None:
+        self.execute = _CountingExecute()
+        self.commit = AsyncMock()
+        self.refresh = AsyncMock()
+        self.add = MagicMock()
+        self.flush = AsyncMock()
+
+    def reset_mock(self) -> None:
+        """Clear recorded calls, return values and side effects on every method."""
+        for method in vars(self).values():
+            method.reset_mock(return_value=True, side_effect=True)
+
+
+def _result(first=None, all_=None, scalar_one=None) -> SimpleNamespace:
+    """
+    Stand-in for the Result returned by session.execute(), covering the
+    result.scalars().first()/.all() and result.scalar_one() calls UserService makes.
+    Plain attributes instead of a MagicMock chain: nothing asserts on these inner calls.
+    """
+    return SimpleNamespace(
+        scalars=lambda: SimpleNamespace(first=lambda: first, all=lambda: all_),
+        scalar_one=lambda: scalar_one,  # BaseService.count
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_db_session() -> _FakeSession:
+    """Fixture to create the fake session shared by the module; _reset_shared_mocks cleans it between tests."""
+    return _FakeSession()
 
-@pytest.fixture
-def mock_db_session() -> AsyncMock:
-    """Fixture to create a mock AsyncSession."""
-    session = AsyncMock(spec=AsyncSession)
-    session.execute = AsyncMock()  # Mock the execute method specifically
-    # Mock nested calls like result.scalars().first()
-    mock_scalar_result = MagicMock()
-    mock_scalar_result.first = MagicMock()
-    mock_scalar_result.all = MagicMock()
-    mock_scalar_result.one_or_none = MagicMock()
 
-    mock_execute_result = MagicMock()
-    mock_execute_result.scalars = MagicMock(return_value=mock_scalar_result)
-    mock_execute_result.scalar_one_or_none = MagicMock()  # For count
+@pytest.fixture(scope="module", autouse=True)
+def mock_get_password_hash() -> Iterator[MagicMock]:
+    """Fixture patching Hasher.get_password_hash once for the whole module."""
+    with patch.object(Hasher, "get_password_hash", return_value="hashed_password") as mock:
+        yield mock
 
-    session.execute.return_value = mock_execute_result
-    return session
 
+@pytest.fixture(autouse=True)
+def _reset_shared_mocks(mock_db_session: _FakeSession, mock_get_password_hash: MagicMock) -> None:
+    """Fixture clearing calls, side effects and configured results left on the module-scoped mocks."""
+    mock_db_session.reset_mock()
+    mock_db_session.execute.return_value = _result()
+    mock_get_password_hash.reset_mock(return_value=True, side_effect=True)
+    mock_get_password_hash.return_value = "hashed_password"
 
-@pytest.fixture
-def user_service(mock_db_session: AsyncMock) -> UserService:
+
+@pytest.fixture(scope="module")
+def user_service(mock_db_session: _FakeSession) -> UserService:
     """Fixture to create a UserService instance with a mock session."""
     return UserService(db_session=mock_db_session)
 
 
-@pytest.mark.asyncio
-async def test_get_user_by_email_found(user_service: UserService, mock_db_session: AsyncMock):
+@pytest.mark.parametrize("user_exists", [True, False], ids=["found", "not-found"])
+async def test_get_user_by_email(user_service: UserService, mock_db_session: _FakeSession, user_exists: bool):
     # Arrange
-    test_email = "test@example.com"
-    mock_user = UserModel(id=1, email=test_email, hashed_password="hashed_pw", is_active=True, roles=[])
+    test_email = _MOCK_USER.email
+    mock_user = _MOCK_USER if user_exists else None
 
-    # Configure the mock for db_session.execute().scalars().first()
-    mock_db_session.execute.return_value.scalars.return_value.first.return_value = mock_user
+    # Configure the result of db_session.execute().scalars().first()
+    mock_db_session.execute.return_value = _result(first=mock_user)
 
     # Act
     found_user = await user_service.get_user_by_email(email=test_email)
 
     # Assert
-    mock_db_session.execute.assert_called_once()  # Check that execute was called
+    assert mock_db_session.execute.call_count == 1  # Check that execute was called
     # You could add more specific assertions about the SQL query if needed,
     # but for unit tests, checking the interaction pattern is often enough.
-    assert found_user is not None
-    assert found_user.email == test_email
-    assert found_user == mock_user
+    assert found_user is mock_user
+    if user_exists:
+        assert found_user.email == test_email
 
 
-@pytest.mark.asyncio
-async def test_get_user_by_email_not_found(user_service: UserService, mock_db_session: AsyncMock):
-    # Arrange
-    test_email = "nonexistent@example.com"
-    mock_db_session.execute.return_value.scalars.return_value.first.return_value = None
-
-    # Act
-    found_user = await user_service.get_user_by_email(email=test_email)
-
-    # Assert
-    mock_db_session.execute.assert_called_once()
-    assert found_user is None
-
-
-@pytest.mark.asyncio
-@patch("app.security.hashing.Hasher.get_password_hash")  # Patch Hasher
-async def test_create_user_success(
+@pytest.mark.parametrize(
+    "user_in, role_names",
+    [(_USER_CREATE_NO_ROLES, []), (_USER_CREATE_WITH_ROLES, ["Editor", "Viewer"])],
+    ids=["no-roles", "with-roles"],
+)
+async def test_create_user(
         mock_get_password_hash: MagicMock,
         user_service: UserService,
-        mock_db_session: AsyncMock
+        mock_db_session: _FakeSession,
+        user_in: UserCreate,
+        role_names: list
 ):
     # Arrange
     mock_get_password_hash.return_value = "hashed_super_password"
-    user_in_schema = UserCreate(
-        email="newuser@example.com",
-        username="genericuser", # Added username
-        password="password123",
-        full_name="New User",
-        role_ids=[]  # No roles for simplicity in this test
-    )
+    roles = [RoleModel(id=role_id, name=name) for role_id, name in zip(user_in.role_ids, role_names)]
 
-    # Mock the refresh operation
-    async def mock_refresh(obj, attribute_names=None):  # Simulate refresh
-        return obj
+    if roles:
+        # Configure the result of fetching the roles
+        mock_db_session.execute.return_value = _result(all_=roles)
 
-    mock_db_session.refresh = AsyncMock(side_effect=mock_refresh)
+        def mock_refresh_roles(obj, attribute_names=None):
+            # Simulate that roles are populated after refresh if attribute_names=['roles']
+            if attribute_names and 'roles' in attribute_names:
+                # This is a simplification; real refresh would hit DB.
+                obj.roles = roles
+
+        # A plain function is enough: the AsyncMock still returns an awaitable
+        mock_db_session.refresh.side_effect = mock_refresh_roles
 
     # Act
-    created_user = await user_service.create_user(user_in=user_in_schema)
+    created_user = await user_service.create_user(user_in=user_in)
 
     # Assert
     mock_get_password_hash.assert_called_once_with("password123")
     mock_db_session.add.assert_called_once()  # Check that db.add was called
     mock_db_session.commit.assert_called_once()
-    mock_db_session.refresh.assert_called_once()
 
     added_user_arg = mock_db_session.add.call_args[0][0]  # Get the object passed to add
+    mock_db_session.refresh.assert_called_once_with(added_user_arg, attribute_names=['roles'])
     assert isinstance(added_user_arg, UserModel)
-    assert added_user_arg.email == user_in_schema.email
-    assert added_user_arg.username == user_in_schema.username # Added assertion
-    assert added_user_arg.full_name == user_in_schema.full_name
+    assert added_user_arg.email == user_in.email
+    assert added_user_arg.username == user_in.username
+    assert added_user_arg.full_name == user_in.full_name
     assert added_user_arg.hashed_password == "hashed_super_password"
-    assert created_user.email == user_in_schema.email
+    assert created_user.email == user_in.email
 
+    # The roles are only queried when role_ids are given
+    assert mock_db_session.execute.call_count == (1 if roles else 0)  # For select(Role)
+    assert created_user.roles == roles
 
-@pytest.mark.asyncio
-@patch("app.security.hashing.Hasher.get_password_hash")
-async def test_create_user_with_roles(
+
+@pytest.mark.parametrize(
+    "user_in, expected_password_hash",
+    [(_USER_UPDATE_PROFILE, None), (_USER_UPDATE_PASSWORD, "new_hashed_password")],
+    ids=["profile", "password"],
+)
+async def test_update_user(
         mock_get_password_hash: MagicMock,
         user_service: UserService,
-        mock_db_session: AsyncMock
+        mock_db_session: _FakeSession,
+        user_in: UserUpdate,
+        expected_password_hash: Optional[str]
 ):
     # Arrange
-    mock_get_password_hash.return_value = "hashed_role_user_password"
-    role_id_1, role_id_2 = 10, 11
-    user_in_schema = UserCreate(
-        email="roleuser@example.com",
-        username="roleuser1", # Added username
-        password="password123",
-        role_ids=[role_id_1, role_id_2]
-    )
-
-    mock_role_1 = RoleModel(id=role_id_1, name="Editor")
-    mock_role_2 = RoleModel(id=role_id_2, name="Viewer")
-
-    # Configure mock for fetching roles
-    mock_db_session.execute.return_value.scalars.return_value.all.return_value = [mock_role_1, mock_role_2]
-
-    async def mock_refresh_roles(obj, attribute_names=None):
-        # Simulate that roles are populated after refresh if attribute_names=['roles']
-        if attribute_names and 'roles' in attribute_names:
-            # This is a simplification; real refresh would hit DB.
-            # For the test, we ensure the created_user object has roles populated as expected.
-            obj.roles = [mock_role_1, mock_role_2]
-        return obj
-
-    mock_db_session.refresh = AsyncMock(side_effect=mock_refresh_roles)
-
-    # Act
-    created_user = await user_service.create_user(user_in=user_in_schema)
-
-    # Assert
-    mock_db_session.add.assert_called_once()
-    added_user_arg = mock_db_session.add.call_args[0][0]
-    assert added_user_arg.email == user_in_schema.email
-    assert added_user_arg.username == user_in_schema.username # Added assertion
-
-
-    # Check that the query for roles was made
-    assert mock_db_session.execute.call_count == 1  # For select(Role)
-    # More detailed assertion for the role query content might be needed if complex
-
-    mock_db_session.commit.assert_called_once()
-    mock_db_session.refresh.assert_called_once_with(added_user_arg, attribute_names=['roles'])
-
-    assert len(created_user.roles) == 2
-    assert mock_role_1 in created_user.roles
-    assert mock_role_2 in created_user.roles
-
-
-@pytest.mark.asyncio
-async def test_update_user_success(user_service: UserService, mock_db_session: AsyncMock):
-    # Arrange
+    mock_get_password_hash.return_value = "new_hashed_password"
     existing_user = UserModel(id=1, email="old@example.com", username="oldname", hashed_password="old_pw", full_name="Old Name",
                               is_active=True, roles=[])
-    user_update_schema = UserUpdate(full_name="New Name", email="new@example.com")
-
-    async def mock_refresh(obj, attribute_names=None): return obj
-
-    mock_db_session.refresh = AsyncMock(side_effect=mock_refresh)
+    # update_user re-fetches the committed user with its relations instead of refreshing it
+    mock_db_session.execute.return_value = _result(first=existing_user)
 
     # Act
-    updated_user = await user_service.update_user(user=existing_user, user_in=user_update_schema)
+    updated_user = await user_service.update_user(user=existing_user, user_in=user_in)
 
     # Assert
     mock_db_session.add.assert_called_once_with(existing_user)  # Check the same object is added
     mock_db_session.commit.assert_called_once()
-    mock_db_session.refresh.assert_called_once_with(existing_user, attribute_names=['roles'])
+    assert mock_db_session.execute.call_count == 1  # The get_user_by_id_with_relations re-fetch
+    mock_db_session.refresh.assert_not_called()
+    assert updated_user is existing_user
 
-    assert updated_user.full_name == "New Name"
-    assert updated_user.email == "new@example.com"
+    for field, value in user_in.model_dump(exclude_unset=True, exclude={"password"}).items():
+        assert getattr(updated_user, field) == value
     assert updated_user.id == 1  # Ensure ID hasn't changed
 
+    if expected_password_hash is None:
+        mock_get_password_hash.assert_not_called()
+        assert updated_user.hashed_password == "old_pw"
+    else:
+        mock_get_password_hash.assert_called_once_with(user_in.password)
+        assert updated_user.hashed_password == expected_password_hash
 
-@pytest.mark.asyncio
-@patch("app.security.hashing.Hasher.get_password_hash")
-async def test_update_user_password_change(
-        mock_get_password_hash: MagicMock,
-        user_service: UserService,
-        mock_db_session: AsyncMock
-):
-    # Arrange
-    mock_get_password_hash.return_value = "new_hashed_password"
-    existing_user = UserModel(id=1, email="user@example.com", username="user1", hashed_password="old_hashed_pw", roles=[])
-    user_update_schema = UserUpdate(password="new_plain_password")
-
-    async def mock_refresh(obj, attribute_names=None): return obj
-
-    mock_db_session.refresh = AsyncMock(side_effect=mock_refresh)
 
-    # Act
-    updated_user = await user_service.update_user(user=existing_user, user_in=user_update_schema)
-
-    # Assert
-    mock_get_password_hash.assert_called_once_with("new_plain_password")
-    assert updated_user.hashed_password == "new_hashed_password"
-    mock_db_session.commit.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_deactivate_user(user_service: UserService, mock_db_session: AsyncMock):
+async def test_deactivate_user(user_service: UserService, mock_db_session: _FakeSession):
     # Arrange
     active_user = UserModel(id=1, email="active@example.com", username="activeuser", is_active=True, roles=[])
-
-    async def mock_refresh(obj): return obj  # Simplified refresh
-
-    mock_db_session.refresh = AsyncMock(side_effect=mock_refresh)
+    # deactivate_user re-fetches the committed user with its relations instead of refreshing it
+    mock_db_session.execute.return_value = _result(first=active_user)
 
     # Act
     deactivated_user = await user_service.deactivate_user(user=active_user)
@@ -234,63 +256,48 @@ async def test_deactivate_user(user_service: UserService, mock_db_session: Async
     # Assert
     mock_db_session.add.assert_called_once_with(active_user)
     mock_db_session.commit.assert_called_once()
-    mock_db_session.refresh.assert_called_once_with(active_user)
+    assert mock_db_session.execute.call_count == 1  # The get_user_by_id_with_relations re-fetch
+    mock_db_session.refresh.assert_not_called()
+    assert deactivated_user is active_user
     assert deactivated_user.is_active is False
 
 
-@pytest.mark.asyncio
-async def test_get_multi_with_pagination(user_service: UserService, mock_db_session: AsyncMock):
+async def test_get_multi_with_pagination(user_service: UserService, mock_db_session: _FakeSession):
     # Arrange
-    mock_users = [UserModel(id=i, email=f"user{i}@example.com", username=f"user{i}", roles=[]) for i in range(5)]
-    mock_db_session.execute.return_value.scalars.return_value.all.return_value = mock_users
+    mock_db_session.execute.return_value = _result(all_=_MOCK_USERS)
 
     # Act
-    users = await user_service.get_multi_with_pagination(skip=0, limit=5)
+    users = await user_service.get_multi_with_pagination(offset=0, limit=5)
 
     # Assert
-    mock_db_session.execute.assert_called_once()
-    assert len(users) == 5
-    assert users == mock_users
+    assert mock_db_session.execute.call_count == 1
+    assert users is _MOCK_USERS
 
 
-@pytest.mark.asyncio
-async def test_get_total_user_count(user_service: UserService, mock_db_session: AsyncMock):
+async def test_get_total_user_count(user_service: UserService, mock_db_session: _FakeSession):
     # Arrange
-    # The count method in BaseService uses `scalar_one_or_none` or `scalar_one`
-    # So we mock `session.execute().scalar_one_or_none()` or `scalar_one()`
-    mock_db_session.execute.return_value.scalar_one.return_value = 25
+    # The count method in BaseService returns `session.execute(...).scalar_one()`
+    mock_db_session.execute.return_value = _result(scalar_one=25)
 
     # Act
     count = await user_service.get_total_user_count()
 
     # Assert
-    mock_db_session.execute.assert_called_once()
+    assert mock_db_session.execute.call_count == 1
     assert count == 25
 
 # --- New tests for username functionality ---
 
-@pytest.mark.asyncio
-@patch("app.security.hashing.Hasher.get_password_hash")
 async def test_create_user_with_username(
         mock_get_password_hash: MagicMock,
         user_service: UserService,
-        mock_db_session: AsyncMock
+        mock_db_session: _FakeSession
 ):
     # Arrange
     mock_get_password_hash.return_value = "hashed_username_password"
-    user_in_schema = UserCreate(
-        email="userwithname@example.com",
-        username="testuser",
-        password="password123",
-        full_name="Test User Name",
-        role_ids=[]
-    )
-
-    async def mock_refresh(obj, attribute_names=None): return obj
-    mock_db_session.refresh = AsyncMock(side_effect=mock_refresh)
 
     # Act
-    created_user = await user_service.create_user(user_in=user_in_schema)
+    created_user = await user_service.create_user(user_in=_USER_CREATE_WITH_USERNAME)
 
     # Assert
     mock_get_password_hash.assert_called_once_with("password123")
@@ -306,89 +313,75 @@ async def test_create_user_with_username(
 
 
     assert isinstance(added_user_arg, UserModel)
-    assert added_user_arg.email == user_in_schema.email
-    assert added_user_arg.username == user_in_schema.username
-    assert added_user_arg.full_name == user_in_schema.full_name
+    assert added_user_arg.email == _USER_CREATE_WITH_USERNAME.email
+    assert added_user_arg.username == _USER_CREATE_WITH_USERNAME.username
+    assert added_user_arg.full_name == _USER_CREATE_WITH_USERNAME.full_name
     assert added_user_arg.hashed_password == "hashed_username_password"
-    assert created_user.username == user_in_schema.username
-    assert created_user.email == user_in_schema.email # Also check email on returned obj
+    assert created_user.username == _USER_CREATE_WITH_USERNAME.username
+    assert created_user.email == _USER_CREATE_WITH_USERNAME.email # Also check email on returned obj
 
 
-@pytest.mark.asyncio
-async def test_get_user_by_username_found(user_service: UserService, mock_db_session: AsyncMock):
+async def test_get_user_by_username_found(user_service: UserService, mock_db_session: _FakeSession):
     # Arrange
-    test_username = "founduser"
-    mock_user = UserModel(id=2, email="found@example.com", username=test_username, hashed_password="hashed_pw", is_active=True, roles=[])
-    # Ensure the mock chain for execute -> scalars -> first is correctly set up
-    mock_db_session.execute.return_value.scalars.return_value.first.return_value = mock_user
-
+    test_username = _MOCK_USER.username
+    # Configure the result of execute -> scalars -> first
+    mock_db_session.execute.return_value = _result(first=_MOCK_USER)
 
     # Act
     found_user = await user_service.get_user_by_username(username=test_username)
 
     # Assert
-    mock_db_session.execute.assert_called_once()
+    assert mock_db_session.execute.call_count == 1
     assert found_user is not None
     assert found_user.username == test_username
-    assert found_user == mock_user
+    assert found_user == _MOCK_USER
 
-@pytest.mark.asyncio
-async def test_get_user_by_username_not_found(user_service: UserService, mock_db_session: AsyncMock):
+async def test_get_user_by_username_not_found(user_service: UserService, mock_db_session: _FakeSession):
     # Arrange
     test_username = "nonexistentuser"
-    mock_db_session.execute.return_value.scalars.return_value.first.return_value = None
+    mock_db_session.execute.return_value = _result(first=None)
 
     # Act
     found_user = await user_service.get_user_by_username(username=test_username)
 
     # Assert
-    mock_db_session.execute.assert_called_once()
+    assert mock_db_session.execute.call_count == 1
     assert found_user is None
 
-@pytest.mark.asyncio
-async def test_update_user_username(user_service: UserService, mock_db_session: AsyncMock):
+async def test_update_user_username(user_service: UserService, mock_db_session: _FakeSession):
     # Arrange
     existing_user_model = UserModel(id=3, email="user@example.com", username="oldusername", hashed_password="pw", roles=[])
-    user_update_schema = UserUpdate(username="newusername")
-
-    async def mock_refresh(obj, attribute_names=None): return obj
-    mock_db_session.refresh = AsyncMock(side_effect=mock_refresh)
+    # update_user re-fetches the committed user with its relations instead of refreshing it
+    mock_db_session.execute.return_value = _result(first=existing_user_model)
 
     # Act
     # Note: user_service.update_user takes the model instance, not id
-    updated_user = await user_service.update_user(user=existing_user_model, user_in=user_update_schema)
+    updated_user = await user_service.update_user(user=existing_user_model, user_in=_USER_UPDATE_USERNAME)
 
     # Assert
     mock_db_session.add.assert_called_once_with(existing_user_model)
     mock_db_session.commit.assert_called_once()
-    mock_db_session.refresh.assert_called_once_with(existing_user_model, attribute_names=['roles'])
+    assert mock_db_session.execute.call_count == 1  # The get_user_by_id_with_relations re-fetch
+    mock_db_session.refresh.assert_not_called()
     assert updated_user.username == "newusername"
     assert updated_user.id == 3
 
-@pytest.mark.asyncio
-@patch("app.security.hashing.Hasher.get_password_hash")
 async def test_create_user_duplicate_username(
     mock_get_password_hash: MagicMock, # Unused but kept for consistency if schema needs password
     user_service: UserService,
-    mock_db_session: AsyncMock
+    mock_db_session: _FakeSession
 ):
     # Arrange
     mock_get_password_hash.return_value = "hashed_password" # Needed by UserCreate if password is provided
-    user_in_schema = UserCreate(
-        email="duplicate@example.com",
-        username="existinguser",
-        password="password123", # UserCreate requires password
-        role_ids=[]
-    )
-
     # Configure commit to raise IntegrityError
     # Ensure the original exception is an actual exception instance
-    mock_db_session.commit = AsyncMock(side_effect=IntegrityError("duplicate key value violates unique constraint", params={}, orig=Exception("DB specific error")))
+    # (set on the shared commit mock; _reset_shared_mocks clears the side effect afterwards)
+    mock_db_session.commit.side_effect = IntegrityError("duplicate key value violates unique constraint", params={}, orig=Exception("DB specific error"))
 
 
     # Act & Assert
     with pytest.raises(IntegrityError): # Assuming the service re-raises IntegrityError directly
-        await user_service.create_user(user_in=user_in_schema)
+        await user_service.create_user(user_in=_USER_CREATE_DUPLICATE)
 
     # Assert that add was called but refresh was not (due to commit error)
     mock_db_session.add.assert_called_once()
@@ -0,0 +1,68 @@
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.database.models.permission import Permission
+from app.database.models.role import Role
+from app.database.models.user import User
+from app.schemas.user import User as UserSchema
+from app.services.user_service import UserService
+
+# users, roles, permissions: one SELECT per selectinload level, however many users are fetched
+EXPECTED_QUERIES = 3
+NUM_USERS = 10
+
+
+@contextmanager
+def count_queries(engine: AsyncEngine) -> Iterator[List[str]]:
+    """Collects the SQL statements executed on `engine` inside the block."""
+    statements: List[str] = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+
+
+@pytest.fixture
+async def users_with_permissions(db_session: AsyncSession) -> int:
+    """Adds NUM_USERS users, each with a role that has permissions; returns the offset of the first."""
+    offset = await UserService(db_session).get_total_user_count()  # e.g. the session-seeded users
+    permissions = [Permission(name=f"eager_perm_{i}") for i in range(2)]
+    roles = [Role(name=f"eager_role_{i}", permissions=permissions) for i in range(2)]
+    db_session.add_all(
+        User(
+            email=f"eager{i}@example.com",
+            username=f"eager{i}",
+            hashed_password="not-a-real-hash",
+            roles=[roles[i % len(roles)]],
+        )
+        for i in range(NUM_USERS)
+    )
+    await db_session.flush()
+    db_session.expunge_all()  # Make the service load everything from the database again
+    return offset
+
+
+@pytest.mark.parametrize("limit", [1, NUM_USERS])
+async def test_get_multi_with_pagination_eager_loads_permissions(
+    db_session: AsyncSession, users_with_permissions: int, limit: int
+):
+    user_service = UserService(db_session)
+
+    with count_queries(db_session.bind.engine) as statements:
+        users = await user_service.get_multi_with_pagination(offset=users_with_permissions, limit=limit)
+        # Serialization must not trigger lazy loads (which would fail outside a greenlet anyway)
+        serialized = [UserSchema.model_validate(user) for user in users]
+
+    assert len(users) == limit
+    # O(1) queries in the number of users: a lazy-loading regression would be 1 + 2N
+    assert len(statements) == EXPECTED_QUERIES, statements
+    assert all(user.roles and user.roles[0].permissions for user in serialized)